@@ -1,26 +1,358 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response, Header, Depends
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from starlette.datastructures import Headers, MutableHeaders
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
 import os
+import re
+import time
+import bisect
+import asyncio
+import functools
+import orjson
+import hmac
+import math
+import socket
+import zlib
+import base64
+import hashlib
+import binascii
+import sys
+import signal
 import logging
+import threading
+import contextvars
+from abc import ABC, abstractmethod
 from pathlib import Path
+from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Literal, Tuple
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from collections import OrderedDict, defaultdict
+from sortedcontainers import SortedList
 from bson import ObjectId
+from bson.errors import InvalidId
+from gridfs.errors import NoFile, FileExists
+from pymongo import monitoring, ASCENDING, DESCENDING, TEXT, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure, PyMongoError
+
+try:
+    import brotli
+except ImportError:  # responses are gzip-only without it
+    brotli = None
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# Metrics: an ASGI middleware records per-route latency histograms, response
+# bytes and in-flight requests, and a PyMongo command listener attributes Mongo
+# round trips and time to the route through a context variable (Motor copies the
+# context into its executor threads). Served as Prometheus text on /api/metrics.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_QUANTILES = (0.5, 0.95, 0.99)
+BACKGROUND_ROUTE = ("-", "background")
+
+class RequestStats:
+    __slots__ = ("db_commands", "db_seconds")
+
+    def __init__(self):
+        self.db_commands = 0
+        self.db_seconds = 0.0
+
+class RouteMetrics:
+    __slots__ = ("buckets", "count", "latency_sum", "response_bytes", "statuses", "db_commands", "db_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # last bucket is +Inf
+        self.count = 0
+        self.latency_sum = 0.0
+        self.response_bytes = 0
+        self.statuses = defaultdict(int)
+        self.db_commands = 0
+        self.db_seconds = 0.0
+
+    def quantile(self, q: float) -> float:
+        # Linear interpolation inside the bucket holding the q-th observation
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for index, upper in enumerate(LATENCY_BUCKETS):
+            in_bucket = self.buckets[index]
+            if in_bucket and seen + in_bucket >= rank:
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+            lower = upper
+        return LATENCY_BUCKETS[-1]
+
+current_request_stats = contextvars.ContextVar("current_request_stats", default=None)
+
+def prometheus_labels(**labels) -> str:
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+class MetricsRegistry:
+    def __init__(self):
+        self.routes = defaultdict(RouteMetrics)  # (method, route template) -> metrics
+        self.in_flight = 0
+        self.lock = threading.Lock()  # command listener callbacks run on executor threads
+
+    def observe(self, method: str, route: str, status: int, seconds: float, body_bytes: int, stats: RequestStats):
+        index = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self.lock:
+            route_metrics = self.routes[(method, route)]
+            route_metrics.buckets[index] += 1
+            route_metrics.count += 1
+            route_metrics.latency_sum += seconds
+            route_metrics.response_bytes += body_bytes
+            route_metrics.statuses[status] += 1
+            route_metrics.db_commands += stats.db_commands
+            route_metrics.db_seconds += stats.db_seconds
+
+    def observe_command(self, seconds: float):
+        stats = current_request_stats.get()
+        with self.lock:
+            if stats is None:
+                stats = self.routes[BACKGROUND_ROUTE]
+            stats.db_commands += 1
+            stats.db_seconds += seconds
+
+    def render(self) -> str:
+        with self.lock:
+            routes = sorted(self.routes.items())
+            in_flight = self.in_flight
+        lines = [
+            "# HELP http_requests_in_flight Requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        served = [(key, metrics) for key, metrics in routes if metrics.count]
+        for (method, route), metrics in served:
+            cumulative = 0
+            for upper, count in zip(LATENCY_BUCKETS + ("+Inf",), metrics.buckets):
+                cumulative += count
+                lines.append(f"http_request_duration_seconds_bucket{prometheus_labels(method=method, route=route, le=upper)} {cumulative}")
+            labels = prometheus_labels(method=method, route=route)
+            lines.append(f"http_request_duration_seconds_sum{labels} {metrics.latency_sum:.6f}")
+            lines.append(f"http_request_duration_seconds_count{labels} {metrics.count}")
+        lines += [
+            "# HELP http_request_duration_quantile_seconds Latency quantiles estimated from the histogram.",
+            "# TYPE http_request_duration_quantile_seconds gauge",
+        ]
+        for (method, route), metrics in served:
+            for q in METRICS_QUANTILES:
+                labels = prometheus_labels(method=method, route=route, quantile=q)
+                lines.append(f"http_request_duration_quantile_seconds{labels} {metrics.quantile(q):.6f}")
+        lines += [
+            "# HELP http_responses_total Responses by route and status.",
+            "# TYPE http_responses_total counter",
+        ]
+        for (method, route), metrics in served:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f"http_responses_total{prometheus_labels(method=method, route=route, status=status)} {count}")
+        lines += [
+            "# HELP http_response_bytes_total Response body bytes by route.",
+            "# TYPE http_response_bytes_total counter",
+        ]
+        for (method, route), metrics in served:
+            lines.append(f"http_response_bytes_total{prometheus_labels(method=method, route=route)} {metrics.response_bytes}")
+        lines += [
+            "# HELP mongo_commands_total Mongo round trips by route.",
+            "# TYPE mongo_commands_total counter",
+        ]
+        for (method, route), metrics in routes:
+            lines.append(f"mongo_commands_total{prometheus_labels(method=method, route=route)} {metrics.db_commands}")
+        lines += [
+            "# HELP mongo_command_duration_seconds_total Time spent in Mongo commands by route.",
+            "# TYPE mongo_command_duration_seconds_total counter",
+        ]
+        for (method, route), metrics in routes:
+            lines.append(f"mongo_command_duration_seconds_total{prometheus_labels(method=method, route=route)} {metrics.db_seconds:.6f}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        metrics.observe_command(event.duration_micros / 1e6)
+
+    def failed(self, event):
+        metrics.observe_command(event.duration_micros / 1e6)
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status = 500
+        body_bytes = 0
+
+        async def send_with_metrics(message):
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            metrics.in_flight -= 1
+            current_request_stats.reset(token)
+            # The router stores the matched route in the scope; unmatched paths
+            # share one label to keep cardinality bounded
+            route = scope.get("route")
+            metrics.observe(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status,
+                time.perf_counter() - started,
+                body_bytes,
+                stats,
+            )
+
+# Response compression, negotiated from Accept-Encoding: brotli when available,
+# else gzip. Complete bodies under COMPRESSION_MIN_BYTES go out as they are.
+# Streamed bodies are compressed chunk by chunk with a sync flush, so NDJSON
+# exports stay incremental. Event streams and media are passed through.
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', '1024'))
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', '4'))
+UNCOMPRESSED_TYPES = ("text/event-stream", "image/", "video/", "audio/", "application/zip", "application/gzip")
+
+class GzipStream:
+    def __init__(self):
+        self.compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class BrotliStream:
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        output = self.compressor.process(data)
+        return output + (self.compressor.finish() if final else self.compressor.flush())
+
+COMPRESSORS = {"br": BrotliStream, "gzip": GzipStream} if brotli else {"gzip": GzipStream}
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, *params = [item.strip() for item in part.split(";")]
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if name:
+            weights[name.lower()] = weight
+    # Ties go to the earlier entry in COMPRESSORS
+    candidates = [(weights.get(name, weights.get("*", 0.0)), -rank, name) for rank, name in enumerate(COMPRESSORS)]
+    weight, _, name = max(candidates)
+    return name if weight > 0 else None
+
+class CompressionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            return await self.app(scope, receive, send)
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+        start = None
+        stream = None
+
+        async def send_compressed(message):
+            nonlocal start, stream
+            if message["type"] == "http.response.start":
+                start = message  # held until the first body chunk decides
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                response_start, start = start, None
+                headers = MutableHeaders(raw=response_start["headers"])
+                if (
+                    response_start["status"] in (204, 206, 304)
+                    or "content-encoding" in headers
+                    or headers.get("content-type", "").startswith(UNCOMPRESSED_TYPES)
+                    or (not more_body and len(body) < COMPRESSION_MIN_BYTES)
+                ):
+                    await send(response_start)
+                    return await send(message)
+                stream = COMPRESSORS[encoding]()
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    # The tag names the identity bytes; etag_matches already
+                    # accepts the weak form when the client sends it back
+                    headers["ETag"] = "W/" + etag
+                if "content-length" in headers:
+                    del headers["content-length"]
+                await send(response_start)
+            if stream is not None:
+                message = {**message, "body": stream.compress(body, final=not more_body)}
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+# MongoDB connection, opened per worker process in the app lifespan so that no
+# client is shared across a fork. Pool sizes apply to each worker.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '5'))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '300000'))
+client = None
+db = None
+image_bucket = None
 
-# Create the main app
-app = FastAPI()
-api_router = APIRouter(prefix="/api")
+def connect_mongo():
+    global client, db, image_bucket
+    client = AsyncIOMotorClient(
+        mongo_url,
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+        event_listeners=[MongoCommandMetrics()],
+    )
+    db = client[os.environ['DB_NAME']]
+    image_bucket = AsyncIOMotorGridFSBucket(db, bucket_name="images")
+
+# Admin-only endpoints are disabled unless ADMIN_TOKEN is configured
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+IST = ZoneInfo("Asia/Kolkata")
+GUEST_EMAIL = "guest@swadeshi.in"
+# Upper bound on the XP one game can award; scores are posted unauthenticated
+MAX_XP_PER_GAME = int(os.environ.get('MAX_XP_PER_GAME', '100'))
+
+api_router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
 
 # Models
 class User(BaseModel):
@@ -36,7 +368,8 @@ class NewsArticle(BaseModel):
     summary_hi: str
     content_en: str
     content_hi: str
-    image_base64: str
+    image_base64: Optional[str] = None  # data URI accepted on create, moved to the image store
+    image_sha256: Optional[str] = None
     truth_score: float
     source: str
     fact_vs_claim_en: str = ""
@@ -51,21 +384,25 @@ class Poll(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 class VoteRequest(BaseModel):
-    vote: str  # "yes" or "no"
+    vote: Literal["yes", "no"]
+    state: Optional[str] = Field(None, max_length=60)  # voter's state, for the per-state breakdown
 
 class GameScore(BaseModel):
-    user_email: Optional[str] = "guest@swadeshi.in"
+    user_email: Optional[str] = GUEST_EMAIL
     game_id: str
-    score: int
-    xp_earned: int
+    score: int = Field(..., ge=0)
+    xp_earned: int = Field(..., ge=0, le=MAX_XP_PER_GAME)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+class GameScoreBatch(BaseModel):
+    scores: List[GameScore] = Field(..., min_length=1, max_length=100)
+
 class Quote(BaseModel):
     quote_en: str
     quote_hi: str
     author_en: str = "Swadeshi Hind"
     author_hi: str = "स्वदेशी हिन्द"
-    date: str
+    date: Optional[str] = Field(None, pattern=r"^\d{4}-\d{2}-\d{2}$")  # pins the quote to a day; others rotate
 
 class VolunteerForm(BaseModel):
     name: str
@@ -75,11 +412,203 @@ class VolunteerForm(BaseModel):
     message: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-# Initialize sample data
-@app.on_event("startup")
-async def initialize_data():
-    # Check if collections are empty and seed data
-    if await db.news.count_documents({}) == 0:
+# Resource versions: bumped on every write and synced between workers through
+# the resource_versions collection, so unchanged reads can be answered with a
+# 304 from memory. Other workers observe a bump within VERSION_SYNC_SECONDS.
+VERSION_SYNC_SECONDS = float(os.environ.get('VERSION_SYNC_SECONDS', '1'))
+
+class ResourceVersions:
+    def __init__(self, *names: str):
+        self.versions = dict.fromkeys(names, 0)
+
+    def etag(self, resources, variant: str = "") -> str:
+        key = ";".join(f"{name}={self.versions[name]}" for name in resources) + "|" + variant
+        return '"' + hashlib.blake2b(key.encode(), digest_size=12).hexdigest() + '"'
+
+    async def bump(self, name: str):
+        doc = await db.resource_versions.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.versions[name] = max(self.versions[name], doc["version"])
+
+    async def sync(self):
+        async for doc in db.resource_versions.find({"_id": {"$in": list(self.versions)}}):
+            self.versions[doc["_id"]] = max(self.versions[doc["_id"]], doc["version"])
+
+    async def run_sync_loop(self):
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Resource version sync failed")
+            await asyncio.sleep(VERSION_SYNC_SECONDS)
+
+resource_versions = ResourceVersions("news", "polls", "quotes")
+background_tasks = []
+
+# JSON encoding: orjson with ObjectId support, so Mongo documents are encoded as
+# they come off the cursor without a per-document rewrite of _id
+def bson_default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def encode_json(content) -> bytes:
+    return orjson.dumps(content, default=bson_default, option=orjson.OPT_NON_STR_KEYS)
+
+def json_bytes_response(body: bytes, **kwargs) -> Response:
+    return Response(content=body, media_type="application/json", **kwargs)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+async def conditional_json(request: Request, resources, build, variant: Optional[str] = None):
+    # Answers If-None-Match from the in-memory versions; build() only runs on a
+    # miss and returns the pre-encoded body
+    etag = resource_versions.etag(resources, request.url.query if variant is None else variant)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return json_bytes_response(await build(), headers=headers)
+
+# Response cache: an in-process LRU with TTL in front of the read loaders, with
+# single-flight so concurrent misses share one query. Keys embed the resource
+# version, so a write on any worker (see resource_changed) retires them.
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', '1024'))
+CACHE_TTL_SECONDS = float(os.environ.get('CACHE_TTL_SECONDS', '30'))
+LOAD_ABANDONED = object()  # shared-load result when its leader was cancelled
+
+class CacheBackend(ABC):
+    """Cache shared between workers, consulted after the local LRU misses"""
+
+    @abstractmethod
+    async def get(self, key: str):
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value, ttl: float):
+        ...
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str):
+        ...
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local stand-in for a shared backend, for tests and single-worker runs"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+
+    async def get(self, key: str):
+        entry = self.entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.entries.move_to_end(key)
+            return entry[1]
+        self.entries.pop(key, None)
+        return None
+
+    async def set(self, key: str, value, ttl: float):
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def delete_prefix(self, prefix: str):
+        for key in [key for key in self.entries if key.startswith(prefix)]:
+            del self.entries[key]
+
+CACHE_BACKENDS = {"memory": InMemoryCacheBackend}
+
+class ResponseCache:
+    def __init__(self, max_entries: int, backend: Optional[CacheBackend] = None):
+        self.max_entries = max_entries
+        self.backend = backend
+        self.entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self.inflight = {}  # key -> future shared by concurrent misses
+
+    async def get_or_load(self, key: str, ttl: float, loader):
+        while True:
+            entry = self.entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                return entry[1]
+            if key not in self.inflight:
+                return await self.load(key, ttl, loader)
+            value = await asyncio.shield(self.inflight[key])
+            if value is not LOAD_ABANDONED:
+                return value
+            # The leading request was cancelled; its waiters were not, so retry
+
+    async def load(self, key: str, ttl: float, loader):
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            value = await self.backend.get(key) if self.backend else None
+            if value is None:
+                value = await loader()
+                if self.backend:
+                    await self.backend.set(key, value, ttl)
+            self.put(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.set_result(LOAD_ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't log it as unretrieved
+            raise
+        finally:
+            del self.inflight[key]
+
+    def put(self, key: str, value, ttl: float):
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def invalidate(self, resource: str):
+        prefix = f"{resource}:"
+        for key in [key for key in self.entries if key.startswith(prefix)]:
+            del self.entries[key]
+        if self.backend:
+            await self.backend.delete_prefix(prefix)
+
+cache_backend = os.environ.get('CACHE_BACKEND')
+response_cache = ResponseCache(
+    CACHE_MAX_ENTRIES, CACHE_BACKENDS[cache_backend]() if cache_backend else None
+)
+
+def cached(resource: str, ttl=CACHE_TTL_SECONDS):
+    """Caches a loader's result per arguments; ttl may be a callable returning seconds"""
+
+    def decorator(loader):
+        @functools.wraps(loader)
+        async def wrapper(*args):
+            key = f"{resource}:{resource_versions.versions[resource]}:{loader.__name__}:{args!r}"
+            return await response_cache.get_or_load(
+                key, ttl() if callable(ttl) else ttl, lambda: loader(*args)
+            )
+
+        return wrapper
+
+    return decorator
+
+async def resource_changed(resource: str):
+    # Invalidation hook for every writer of news, polls and quotes
+    await resource_versions.bump(resource)
+    await response_cache.invalidate(resource)
+
+# Seed data for empty collections
+async def seed_collections():
+    if not await db.news.find_one({}, {"_id": 1}):
         sample_news = [
             {
                 "title_en": "India's GDP Growth Exceeds Expectations",
@@ -110,88 +639,1584 @@ async def initialize_data():
                 "created_at": datetime.utcnow()
             }
         ]
+        for article in sample_news:
+            article["updated_at"] = article["created_at"]
         await db.news.insert_many(sample_news)
+        await resource_changed("news")
     
-    if await db.polls.count_documents({}) == 0:
+    if not await db.polls.find_one({}, {"_id": 1}):
         sample_polls = [
             {
                 "question_en": "Should India invest more in renewable energy?",
                 "question_hi": "क्या भारत को अक्षय ऊर्जा में अधिक निवेश करना चाहिए?",
                 "yes": 0,
                 "no": 0,
-                "created_at": datetime.utcnow()
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow(),
             }
         ]
         await db.polls.insert_many(sample_polls)
+        await resource_changed("polls")
     
-    if await db.quotes.count_documents({}) == 0:
+    if not await db.quotes.find_one({}, {"_id": 1}):
         sample_quotes = [
             {
                 "quote_en": "A nation's culture resides in the hearts and souls of its people.",
                 "quote_hi": "एक राष्ट्र की संस्कृति उसके लोगों के दिलों और आत्माओं में निवास करती है।",
                 "author_en": "Mahatma Gandhi",
                 "author_hi": "महात्मा गांधी",
-                "date": datetime.utcnow().strftime("%Y-%m-%d")
+                "updated_at": datetime.utcnow(),
             }
         ]
         await db.quotes.insert_many(sample_quotes)
+        await resource_changed("quotes")
+
+
+# Startup: indexes, seeding and migrations run once per BOOTSTRAP_VERSION, by
+# whichever worker holds the bootstrap lease. Other workers wait for the
+# completion marker, and every worker serves traffic meanwhile and reports
+# readiness through /api/health/ready.
+BOOTSTRAP_VERSION = 5
+BOOTSTRAP_LEASE_SECONDS = 300
+BOOTSTRAP_POLL_SECONDS = 1
+BOOTSTRAP_RETRY_SECONDS = 5
+
+INDEXES = {
+    "news": [
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("updated_at", ASCENDING)]),
+        IndexModel([("source", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # "none" tokenizes on whitespace and punctuation without stemming, which
+        # keeps Devanagari words (including their vowel signs) intact
+        IndexModel(
+            [(f"{field}_{code}", TEXT) for field in ("title", "summary", "content") for code in ("en", "hi")],
+            name="news_text",
+            default_language="none",
+            weights={"title_en": 10, "title_hi": 10, "summary_en": 4, "summary_hi": 4},
+        ),
+    ],
+    "users": [IndexModel([("email", ASCENDING)], unique=True)],
+    "game_scores": [IndexModel([("user_email", ASCENDING), ("game_id", ASCENDING), ("created_at", DESCENDING)])],
+    "volunteers": [IndexModel([("email", ASCENDING)]), IndexModel([("phone_digits", ASCENDING)])],
+    "polls": [IndexModel([("updated_at", ASCENDING)])],
+    "quotes": [IndexModel([("date", ASCENDING)]), IndexModel([("updated_at", ASCENDING)])],
+    "tombstones": [
+        IndexModel([("deleted_at", ASCENDING)]),
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+    "poll_vote_buckets": [
+        IndexModel([("poll_id", ASCENDING), ("granularity", ASCENDING), ("start", ASCENDING)], unique=True),
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+}
+
+async def acquire_lease(collection, name: str, owner: str, seconds: float) -> bool:
+    now = datetime.utcnow()
+    try:
+        await collection.find_one_and_update(
+            {"_id": name, "$or": [{"expires_at": {"$lt": now}}, {"owner": owner}]},
+            {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=seconds)}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False  # held by someone else
+    return True
+
+async def create_indexes():
+    await asyncio.gather(
+        *(db[collection].create_indexes(indexes) for collection, indexes in INDEXES.items())
+    )
+
+class StartupManager:
+    def __init__(self):
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.ready = False
+        self.draining = False
+
+    async def bootstrap(self):
+        while True:
+            state = await db.startup_state.find_one({"_id": "bootstrap"})
+            if state and state.get("version", 0) >= BOOTSTRAP_VERSION:
+                return
+            if await acquire_lease(db.startup_state, "bootstrap_lock", self.owner, BOOTSTRAP_LEASE_SECONDS):
+                try:
+                    logger.info("Bootstrapping database (version %d)", BOOTSTRAP_VERSION)
+                    await create_indexes()
+                    await seed_collections()
+                    await migrate_inline_images()
+                    await backfill_updated_at()
+                    await db.startup_state.update_one(
+                        {"_id": "bootstrap"},
+                        {"$set": {"version": BOOTSTRAP_VERSION, "completed_at": datetime.utcnow(), "by": self.owner}},
+                        upsert=True,
+                    )
+                finally:
+                    await db.startup_state.delete_one({"_id": "bootstrap_lock", "owner": self.owner})
+                return
+            await asyncio.sleep(BOOTSTRAP_POLL_SECONDS)
+
+    async def run(self):
+        while True:
+            try:
+                await self.bootstrap()
+                await resource_versions.sync()
+                await schedule_quotes()
+                await leaderboards.load_snapshot()
+                break
+            except Exception:
+                logger.exception("Startup failed, retrying in %ds", BOOTSTRAP_RETRY_SECONDS)
+                await asyncio.sleep(BOOTSTRAP_RETRY_SECONDS)
+        try:
+            await warm_caches()
+        except Exception:
+            # Not retried: a partial leaderboard refresh must not be replayed, and
+            # cold caches fill on first use anyway
+            logger.exception("Cache warm-up failed, serving with cold caches")
+        background_tasks.append(asyncio.create_task(leaderboards.run_refresh_loop()))
+        self.ready = True
+        logger.info("Worker %s ready", self.owner)
+
+startup = StartupManager()
+
+async def warm_caches():
+    # Fill this worker's caches for the first screens before it reports ready
+    today = ist_now().date().isoformat()
+    loads = [leaderboards.refresh()]
+    for lang in (None,) + LANGUAGES:
+        loads += [
+            load_news_page(None, NEWS_PAGE_DEFAULT, lang),
+            load_polls(lang),
+            load_quote_of_the_day(today, lang),
+        ]
+    await asyncio.gather(*loads)
+
+def start_background_work():
+    background_tasks.append(asyncio.create_task(startup.run()))
+    background_tasks.append(asyncio.create_task(resource_versions.run_sync_loop()))
+    background_tasks.append(asyncio.create_task(poll_votes.run_flush_loop()))
+    background_tasks.append(asyncio.create_task(poll_stream.run_tick_loop()))
+    background_tasks.append(asyncio.create_task(poll_stream.run_change_stream()))
+    background_tasks.append(asyncio.create_task(score_ingestor.run()))
+    background_tasks.append(asyncio.create_task(run_quote_scheduler()))
 
 # API Routes
 @api_router.get("/")
 async def root():
     return {"message": "Swadeshi Hind API", "version": "1.0"}
 
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@api_router.get("/health/ready")
+async def health_ready():
+    if startup.draining:
+        return ORJSONResponse({"status": "draining"}, status_code=503)
+    if not startup.ready:
+        return ORJSONResponse({"status": "starting"}, status_code=503)
+    return {"status": "ready"}
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not ADMIN_TOKEN or not x_admin_token or not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+# Write protection: token buckets per client address and route, and
+# time-windowed Bloom filters that catch repeat votes per X-Device-Id and
+# retried volunteer sign-ups. Behind a reverse proxy the deployment sets
+# TRUSTED_PROXY_HOPS so the client address is taken from X-Forwarded-For; it
+# stays 0 otherwise, since any client can write that header itself.
+TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS', '0'))
+RATE_LIMIT_MAX_KEYS = 100_000
+VOTE_RATE_PER_SECOND = float(os.environ.get('VOTE_RATE_PER_SECOND', '1'))
+VOTE_BURST = int(os.environ.get('VOTE_BURST', '10'))
+VOLUNTEER_RATE_PER_SECOND = float(os.environ.get('VOLUNTEER_RATE_PER_SECOND', str(1 / 30)))
+VOLUNTEER_BURST = int(os.environ.get('VOLUNTEER_BURST', '3'))
+SCORE_RATE_PER_SECOND = float(os.environ.get('SCORE_RATE_PER_SECOND', '1'))
+SCORE_BURST = int(os.environ.get('SCORE_BURST', '10'))
+# Offline batches carry up to 100 scores each, so they get a much slower bucket
+SCORE_BATCH_RATE_PER_SECOND = float(os.environ.get('SCORE_BATCH_RATE_PER_SECOND', str(1 / 60)))
+SCORE_BATCH_BURST = int(os.environ.get('SCORE_BATCH_BURST', '2'))
+DEDUPE_WINDOW_SECONDS = float(os.environ.get('DEDUPE_WINDOW_SECONDS', str(24 * 3600)))
+VOTE_DEDUPE_CAPACITY = int(os.environ.get('VOTE_DEDUPE_CAPACITY', '1000000'))
+# Two keys per sign-up: the email and the phone digits
+VOLUNTEER_DEDUPE_CAPACITY = int(os.environ.get('VOLUNTEER_DEDUPE_CAPACITY', '200000'))
+
+def client_address(request: Request) -> str:
+    if TRUSTED_PROXY_HOPS:
+        forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        if len(forwarded) >= TRUSTED_PROXY_HOPS:
+            return forwarded[-TRUSTED_PROXY_HOPS]
+    return request.client.host if request.client else "unknown"
+
+def device_id(request: Request) -> Optional[str]:
+    # Without a device id the client address would lump a whole carrier NAT
+    # into one voter, so such requests are left to the per-address token bucket.
+    # The app has no voting screen yet; whichever client adds one must send a
+    # persistent X-Device-Id or its votes are never deduplicated.
+    device = (request.headers.get("x-device-id") or "").strip()
+    return device[:128] or None
+
+class RateLimitStore(ABC):
+    """Token bucket state; a shared implementation limits across workers"""
+
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Takes one token and returns 0, or the seconds until one is available"""
+
+class InMemoryRateLimitStore(RateLimitStore):
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()  # key -> (tokens, last refill), least recently used first
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        tokens, updated = self.buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        self.buckets[key] = (tokens, now)
+        if len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)  # evicting idle clients only forgets a refill
+        return wait
+
+rate_limit_store = InMemoryRateLimitStore()
+
+def rate_limit(route: str, rate: float, burst: int):
+    async def check(request: Request):
+        wait = await rate_limit_store.take(f"{route}:{client_address(request)}", rate, burst)
+        if wait:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+
+    return Depends(check)
+
+class WindowedBloomFilter:
+    """Remembers keys for one to two windows in fixed memory; false positives at ~error_rate.
+
+    A generation rotates early once it holds capacity keys, which shortens the
+    window under load instead of letting the false positive rate climb.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, window: float):
+        self.capacity = capacity
+        self.bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.window = window
+        self.current = bytearray((self.bits + 7) // 8)
+        self.previous = bytearray(len(self.current))
+        self.count = 0  # keys added to the current generation
+        self.rotated_at = time.monotonic()
+
+    def positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * step) % self.bits for i in range(self.hashes)]
+
+    def rotate(self):
+        elapsed = time.monotonic() - self.rotated_at
+        if elapsed < self.window and self.count < self.capacity:
+            return
+        self.previous = self.current if elapsed < 2 * self.window else bytearray(len(self.current))
+        self.current = bytearray(len(self.current))
+        self.count = 0
+        self.rotated_at = time.monotonic()
+
+    def __contains__(self, key: str) -> bool:
+        """Whether the key was (probably) added within the window"""
+        self.rotate()
+        positions = self.positions(key)
+        return self.has(self.current, positions) or self.has(self.previous, positions)
+
+    def add(self, key: str):
+        self.rotate()
+        positions = self.positions(key)
+        if self.has(self.current, positions):
+            return
+        for p in positions:
+            self.current[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    @staticmethod
+    def has(bits: bytearray, positions) -> bool:
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+vote_dedupe = WindowedBloomFilter(capacity=VOTE_DEDUPE_CAPACITY, error_rate=0.001, window=DEDUPE_WINDOW_SECONDS)
+volunteer_dedupe = WindowedBloomFilter(capacity=VOLUNTEER_DEDUPE_CAPACITY, error_rate=0.001, window=DEDUPE_WINDOW_SECONDS)
+
+# Image store: blobs live once in the "images" GridFS bucket, keyed by their sha256
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+SHA256_RE = re.compile(r"[0-9a-f]{64}")
+DATA_URI_RE = re.compile(r"data:(?P<content_type>[\w.+-]+/[\w.+-]+);base64,(?P<data>.*)", re.S)
+RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+def decode_data_uri(uri: str):
+    match = DATA_URI_RE.fullmatch(uri.strip())
+    if not match:
+        raise ValueError("Image must be a base64 data URI")
+    try:
+        data = base64.b64decode(match.group("data"), validate=True)
+    except binascii.Error:
+        raise ValueError("Image data is not valid base64")
+    return match.group("content_type"), data
+
+async def store_image(data: bytes, content_type: str) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    if await db["images.files"].count_documents({"_id": digest}, limit=1):
+        return digest
+    try:
+        await image_bucket.upload_from_stream_with_id(
+            digest, digest, data, metadata={"content_type": content_type}
+        )
+    except (FileExists, DuplicateKeyError):
+        pass  # a concurrent upload of the same bytes won the race
+    return digest
+
+async def migrate_inline_images():
+    # One-time rewrite of legacy documents carrying the image inline; idempotent
+    migrated = 0
+    async for article in db.news.find({"image_base64": {"$exists": True}}, {"image_base64": 1}):
+        try:
+            content_type, data = decode_data_uri(article["image_base64"])
+        except ValueError as e:
+            logger.warning("Skipping image migration for news %s: %s", article["_id"], e)
+            continue
+        digest = await store_image(data, content_type)
+        await db.news.update_one(
+            {"_id": article["_id"]},
+            {"$set": {"image_sha256": digest, "updated_at": datetime.utcnow()}, "$unset": {"image_base64": ""}},
+        )
+        migrated += 1
+    if migrated:
+        await resource_changed("news")
+        logger.info("Moved %d inline news images to the image store", migrated)
+
+def parse_byte_range(header: str, size: int):
+    match = RANGE_RE.fullmatch(header.strip())
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if start:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+    else:
+        start, end = max(size - int(end), 0), size - 1
+    if start > end or start >= size:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+@api_router.get("/images/{digest}")
+async def get_image(digest: str, request: Request):
+    if not SHA256_RE.fullmatch(digest):
+        raise HTTPException(status_code=404, detail="Image not found")
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": IMAGE_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    try:
+        grid_out = await image_bucket.open_download_stream(digest)
+    except NoFile:
+        raise HTTPException(status_code=404, detail="Image not found")
+    content_type = (grid_out.metadata or {}).get("content_type", "application/octet-stream")
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == etag):
+        byte_range = parse_byte_range(range_header, grid_out.length)
+    if byte_range is None:
+        return Response(content=await grid_out.read(), media_type=content_type, headers=headers)
+    start, end = byte_range
+    grid_out.seek(start)
+    data = await grid_out.read(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{grid_out.length}"
+    return Response(content=data, status_code=206, media_type=content_type, headers=headers)
+
+# Language scoping: with ?lang=en|hi the projection fetches only that
+# language's variant of each text field and returns it under the unsuffixed
+# name (title, summary, ...). Without it both variants are returned as stored.
+LANGUAGES = ("en", "hi")
+Language = Optional[Literal["en", "hi"]]
+
+def localized_projection(projection: dict, fields, lang: Language) -> dict:
+    if lang is None:
+        return {**projection, **{f"{field}_{code}": 1 for field in fields for code in LANGUAGES}}
+    return {**projection, **{field: f"${field}_{lang}" for field in fields}}
+
+def localize(doc: dict, fields, lang: Language) -> dict:
+    if lang is None:
+        return doc
+    doc = dict(doc)
+    for field in fields:
+        doc[field] = doc.get(f"{field}_{lang}")
+        for code in LANGUAGES:
+            doc.pop(f"{field}_{code}", None)
+    return doc
+
+# News feed
+NEWS_PAGE_DEFAULT = 20
+NEWS_PAGE_MAX = 50
+NEWS_FEED_SORT = [("created_at", -1), ("_id", -1)]
+# Lightweight card shape for the feed; full bodies come from /news/{id}
+NEWS_PROJECTION = {
+    "truth_score": 1,
+    "source": 1,
+    "image_url": {"$concat": ["/api/images/", "$image_sha256"]},  # null without an image; MongoDB 4.4+
+    "created_at": 1,
+}
+NEWS_CARD_FIELDS = ("title", "summary", "fact_vs_claim")
+NEWS_DETAIL_FIELDS = NEWS_CARD_FIELDS + ("content",)
+
+def encode_news_cursor(article: dict) -> str:
+    return f"{article['created_at'].isoformat()},{article['_id']}"
+
+def decode_news_cursor(cursor: str) -> dict:
+    try:
+        created_at, _, article_id = cursor.partition(",")
+        created_at = datetime.fromisoformat(created_at)
+        article_id = ObjectId(article_id)
+    except (ValueError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Keyset condition matching NEWS_FEED_SORT: strictly older, ties broken by _id
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": article_id}},
+        ]
+    }
+
+def parse_object_id(value: str, detail: str = "Not found") -> ObjectId:
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=404, detail=detail)
+
+@cached("news")
+async def load_news_page(after: Optional[str], limit: int, lang: Language) -> bytes:
+    query = decode_news_cursor(after) if after else {}
+    projection = localized_projection(NEWS_PROJECTION, NEWS_CARD_FIELDS, lang)
+    news = await db.news.find(query, projection).sort(NEWS_FEED_SORT).limit(limit).to_list(limit)
+    next_cursor = encode_news_cursor(news[-1]) if len(news) == limit else None
+    return encode_json({"news": news, "next_cursor": next_cursor})
+
 @api_router.get("/news")
-async def get_news():
-    news = await db.news.find().sort("created_at", -1).to_list(100)
-    for article in news:
-        article["_id"] = str(article["_id"])
-    return {"news": news}
+async def get_news(
+    request: Request,
+    after: Optional[str] = None,
+    limit: int = Query(NEWS_PAGE_DEFAULT, ge=1, le=NEWS_PAGE_MAX),
+    lang: Language = None,
+):
+    return await conditional_json(request, ("news",), lambda: load_news_page(after, limit, lang))
+
+@cached("news")
+async def load_news_search(
+    q: Optional[str],
+    source: Optional[str],
+    min_truth: Optional[float],
+    max_truth: Optional[float],
+    after: Optional[str],
+    limit: int,
+    lang: Language,
+) -> bytes:
+    filters = []
+    if q:
+        filters.append({"$text": {"$search": q}})
+    if source:
+        filters.append({"source": source})
+    if min_truth is not None or max_truth is not None:
+        truth_range = {}
+        if min_truth is not None:
+            truth_range["$gte"] = min_truth
+        if max_truth is not None:
+            truth_range["$lte"] = max_truth
+        filters.append({"truth_score": truth_range})
+    if after:
+        filters.append(decode_news_cursor(after))
+    query = {"$and": filters} if filters else {}
+    projection = localized_projection(NEWS_PROJECTION, NEWS_CARD_FIELDS, lang)
+    # Newest first rather than by text score, so the feed cursor pages results too
+    news = await db.news.find(query, projection).sort(NEWS_FEED_SORT).limit(limit).to_list(limit)
+    next_cursor = encode_news_cursor(news[-1]) if len(news) == limit else None
+    return encode_json({"news": news, "next_cursor": next_cursor})
+
+@api_router.get("/news/search")
+async def search_news(
+    request: Request,
+    q: Optional[str] = Query(None, max_length=200),
+    source: Optional[str] = None,
+    min_truth: Optional[float] = Query(None, ge=0, le=1),
+    max_truth: Optional[float] = Query(None, ge=0, le=1),
+    after: Optional[str] = None,
+    limit: int = Query(NEWS_PAGE_DEFAULT, ge=1, le=NEWS_PAGE_MAX),
+    lang: Language = None,
+):
+    return await conditional_json(
+        request,
+        ("news",),
+        lambda: load_news_search(q, source, min_truth, max_truth, after, limit, lang),
+    )
+
+# Exports stream straight from the Motor cursor in EXPORT_CHUNK_BYTES chunks,
+# as NDJSON or a chunked JSON array, so memory per request stays flat however
+# many documents match
+EXPORT_BATCH_SIZE = 200
+EXPORT_CHUNK_BYTES = 64 * 1024
+ExportFormat = Optional[Literal["ndjson", "json"]]
+
+async def stream_cursor(cursor, export_format: str):
+    buffer = bytearray(b"[" if export_format == "json" else b"")
+    separator = b""
+    try:
+        async for doc in cursor:
+            if export_format == "json":
+                buffer += separator
+                separator = b","
+                buffer += encode_json(doc)
+            else:
+                buffer += encode_json(doc) + b"\n"
+            if len(buffer) >= EXPORT_CHUNK_BYTES:
+                yield bytes(buffer)
+                buffer.clear()
+        if export_format == "json":
+            buffer += b"]"
+        yield bytes(buffer)
+    finally:
+        await cursor.close()
+
+def export_response(cursor, export_format: ExportFormat, filename: Optional[str] = None) -> StreamingResponse:
+    export_format = export_format or "ndjson"
+    headers = {"Cache-Control": "no-store"}
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return StreamingResponse(
+        stream_cursor(cursor.batch_size(EXPORT_BATCH_SIZE), export_format),
+        media_type="application/x-ndjson" if export_format == "ndjson" else "application/json",
+        headers=headers,
+    )
+
+@api_router.get("/news/export")
+async def export_news(format: ExportFormat = None, lang: Language = None):
+    # The whole feed in feed order, full bodies included
+    projection = localized_projection(NEWS_PROJECTION, NEWS_DETAIL_FIELDS, lang)
+    return export_response(db.news.find({}, projection).sort(NEWS_FEED_SORT), format)
+
+@api_router.get("/news/{article_id}")
+async def get_news_article(article_id: str, lang: Language = None):
+    article = await load_news_article(parse_object_id(article_id, "Article not found"), lang)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return json_bytes_response(article)
+
+@cached("news")
+async def load_news_article(article_id: ObjectId, lang: Language) -> Optional[bytes]:
+    projection = localized_projection(NEWS_PROJECTION, NEWS_DETAIL_FIELDS, lang)
+    article = await db.news.find_one({"_id": article_id}, projection)
+    return encode_json(article) if article else None
+
+@api_router.post("/news", dependencies=[Depends(require_admin)])
+async def create_news_article(article: NewsArticle):
+    article_dict = article.dict()
+    image = article_dict.pop("image_base64")
+    if image:
+        try:
+            content_type, data = decode_data_uri(image)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        article_dict["image_sha256"] = await store_image(data, content_type)
+    article_dict["updated_at"] = datetime.utcnow()
+    result = await db.news.insert_one(article_dict)
+    await resource_changed("news")
+    return {"success": True, "id": str(result.inserted_id), "image_sha256": article_dict["image_sha256"]}
+
+@api_router.delete("/news/{article_id}", dependencies=[Depends(require_admin)])
+async def delete_news_article(article_id: str):
+    # The image stays in the store; it is content-addressed and may be shared
+    await delete_with_tombstone("news", parse_object_id(article_id, "Article not found"), "Article not found")
+    return {"success": True}
+
+POLL_PROJECTION = {"yes": 1, "no": 1, "created_at": 1}
+POLL_FIELDS = ("question",)
+
+@cached("polls")
+async def load_polls(lang: Language = None) -> bytes:
+    projection = localized_projection(POLL_PROJECTION, POLL_FIELDS, lang)
+    return encode_json({"polls": await db.polls.find({}, projection).to_list(100)})
 
 @api_router.get("/polls")
-async def get_polls():
-    polls = await db.polls.find().to_list(100)
-    for poll in polls:
-        poll["_id"] = str(poll["_id"])
-    return {"polls": polls}
-
-@api_router.post("/polls/{poll_id}/vote")
-async def vote_poll(poll_id: str, vote_request: VoteRequest):
+async def get_polls(request: Request, lang: Language = None):
+    return await conditional_json(request, ("polls",), lambda: load_polls(lang))
+
+# Poll votes are aggregated in process and flushed every VOTE_FLUSH_SECONDS with
+# one find_one_and_update per hot poll, instead of two round trips per vote.
+# The same flush rolls votes up into poll_vote_buckets: one document per poll
+# and IST minute, hour and day, with a per-state breakdown, so vote history is
+# read from pre-aggregated buckets. Minute and hour buckets expire via TTL.
+VOTE_FLUSH_SECONDS = float(os.environ.get('VOTE_FLUSH_SECONDS', '0.25'))
+VOTE_OPTIONS = ("yes", "no")
+VOTE_BUCKET_RETENTION = {
+    "minute": timedelta(days=float(os.environ.get('VOTE_MINUTE_BUCKET_DAYS', '2'))),
+    "hour": timedelta(days=float(os.environ.get('VOTE_HOUR_BUCKET_DAYS', '90'))),
+    "day": None,
+}
+
+INDIAN_STATES = (
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh", "Goa", "Gujarat",
+    "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka", "Kerala", "Madhya Pradesh",
+    "Maharashtra", "Manipur", "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Punjab", "Rajasthan",
+    "Sikkim", "Tamil Nadu", "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
+    "Andaman and Nicobar Islands", "Chandigarh", "Dadra and Nagar Haveli and Daman and Diu",
+    "Delhi", "Jammu and Kashmir", "Ladakh", "Lakshadweep", "Puducherry",
+)
+
+def slugify_state(name: str) -> str:
+    return re.sub(r"[^a-z]+", "_", name.lower()).strip("_")
+
+STATE_KEYS = {slugify_state(name) for name in INDIAN_STATES}
+
+def state_key(state: Optional[str]) -> Optional[str]:
+    # Bucket field names come from a fixed set so free text cannot grow the documents
+    if not state or not state.strip():
+        return None
+    key = slugify_state(state)
+    return key if key in STATE_KEYS else "other"
+
+def vote_bucket_starts(moment: datetime) -> dict:
+    local = moment.replace(tzinfo=timezone.utc).astimezone(IST).replace(second=0, microsecond=0)
+    starts = {"minute": local, "hour": local.replace(minute=0), "day": local.replace(hour=0, minute=0)}
+    return {granularity: start.astimezone(timezone.utc).replace(tzinfo=None) for granularity, start in starts.items()}
+
+class PollVoteBuffer:
+    def __init__(self):
+        self.pending = {}  # poll _id -> unflushed increments per option
+        self.flushing = {}  # poll _id -> increments being written by the current flush
+        self.tallies = {}  # poll _id -> poll document as of the last flush
+        self.buckets = {}  # (poll _id, granularity, start) -> unflushed $inc document
+        self.flush_lock = asyncio.Lock()
+
+    async def add(self, poll_id: ObjectId, vote: str, state: Optional[str] = None) -> dict:
+        if poll_id not in self.tallies:
+            poll = await db.polls.find_one({"_id": poll_id})
+            if not poll:
+                raise HTTPException(status_code=404, detail="Poll not found")
+            self.tallies.setdefault(poll_id, poll)
+        counts = self.pending.setdefault(poll_id, dict.fromkeys(VOTE_OPTIONS, 0))
+        counts[vote] += 1
+        fields = [vote, f"states.{state}.{vote}"] if state else [vote]
+        for granularity, start in vote_bucket_starts(datetime.utcnow()).items():
+            bucket = self.buckets.setdefault((poll_id, granularity, start), {})
+            for field in fields:
+                bucket[field] = bucket.get(field, 0) + 1
+        return self.view(poll_id)
+
+    def view(self, poll_id: ObjectId) -> dict:
+        poll = dict(self.tallies[poll_id])
+        # In-flight increments count until the flush installs the new tallies,
+        # so a vote accepted mid-flush never sees the tally go backwards
+        for counts in (self.flushing.get(poll_id, {}), self.pending.get(poll_id, {})):
+            for option, count in counts.items():
+                poll[option] = poll.get(option, 0) + count
+        poll["_id"] = str(poll_id)
+        return poll
+
+    async def flush(self):
+        async with self.flush_lock:
+            batch, self.pending = self.pending, {}
+            buckets, self.buckets = self.buckets, {}
+            if not batch:
+                # Idle polls are re-read on their next vote rather than served stale
+                self.tallies.clear()
+                await self._apply_buckets(buckets)
+                return
+            poll_ids = list(batch)
+            self.flushing = batch
+            try:
+                results, _ = await asyncio.gather(
+                    asyncio.gather(
+                        *(self._apply(poll_id, batch[poll_id]) for poll_id in poll_ids),
+                        return_exceptions=True,
+                    ),
+                    self._apply_buckets(buckets),
+                )
+            except BaseException:
+                self.flushing = {}
+                raise
+            # No awaits from here until the tallies are installed
+            tallies = {}
+            for poll_id, result in zip(poll_ids, results):
+                if isinstance(result, Exception):
+                    logger.error("Vote flush for poll %s failed, retrying: %s", poll_id, result)
+                    retry = self.pending.setdefault(poll_id, dict.fromkeys(VOTE_OPTIONS, 0))
+                    for option, count in batch[poll_id].items():
+                        retry[option] += count
+                    tallies[poll_id] = self.tallies[poll_id]
+                elif result is not None:
+                    tallies[poll_id] = result
+                    if not poll_stream.change_stream_active:
+                        poll_stream.publish(result)
+            for poll_id in self.pending:
+                # Votes that arrived while this flush was in flight
+                if poll_id not in tallies and poll_id in self.tallies:
+                    tallies[poll_id] = self.tallies[poll_id]
+            self.tallies = tallies
+            self.flushing = {}
+            await resource_changed("polls")
+
+    async def _apply(self, poll_id: ObjectId, counts: dict):
+        return await db.polls.find_one_and_update(
+            {"_id": poll_id},
+            {"$inc": {option: count for option, count in counts.items() if count}, "$set": {"updated_at": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _apply_buckets(self, buckets: dict):
+        if not buckets:
+            return
+        keys = list(buckets)
+        requests = []
+        for poll_id, granularity, start in keys:
+            update = {"$inc": buckets[(poll_id, granularity, start)]}
+            if VOTE_BUCKET_RETENTION[granularity]:
+                update["$setOnInsert"] = {"expires_at": start + VOTE_BUCKET_RETENTION[granularity]}
+            requests.append(UpdateOne({"poll_id": poll_id, "granularity": granularity, "start": start}, update, upsert=True))
+        try:
+            await db.poll_vote_buckets.bulk_write(requests, ordered=False)
+            return
+        except BulkWriteError as e:
+            # Includes duplicate keys from concurrent upserts by other workers
+            errors = e.details.get("writeErrors", [])
+            failed = [keys[err["index"]] for err in errors]
+            logger.warning("Retrying %d vote buckets: %s", len(failed), errors[0].get("errmsg") if errors else e)
+        except PyMongoError as e:
+            failed = keys
+            logger.error("Vote bucket flush failed, retrying: %s", e)
+        for key in failed:
+            retry = self.buckets.setdefault(key, {})
+            for field, count in buckets[key].items():
+                retry[field] = retry.get(field, 0) + count
+
+    async def run_flush_loop(self):
+        while True:
+            await asyncio.sleep(VOTE_FLUSH_SECONDS)
+            try:
+                # Shielded: cancelling the loop at shutdown must not drop a batch
+                # mid-write; the final flush() waits for it on flush_lock
+                await asyncio.shield(self.flush())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Vote flush failed")
+
+poll_votes = PollVoteBuffer()
+
+# Live poll results: each worker holds one upstream source (a change stream on
+# polls, or its own vote flushes when the deployment has no change streams) and
+# fans coalesced updates out to every SSE subscriber once per tick.
+POLL_STREAM_TICK_SECONDS = float(os.environ.get('POLL_STREAM_TICK_SECONDS', '0.25'))
+POLL_STREAM_HEARTBEAT_SECONDS = 15
+POLL_STREAM_QUEUE_SIZE = 16
+# Streams end after this long so a draining worker is not held open by them;
+# EventSource reconnects (to any worker) after the advertised retry delay
+POLL_STREAM_MAX_SECONDS = float(os.environ.get('POLL_STREAM_MAX_SECONDS', '300'))
+POLL_STREAM_RETRY_MS = 1000
+CHANGE_STREAM_RETRY_SECONDS = 5
+
+def sse_event(event: str, payload: bytes) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + payload + b"\n\n"
+
+class PollBroadcaster:
+    def __init__(self):
+        self.subscribers = set()
+        self.dirty = {}  # poll _id -> latest document, coalesced until the next tick
+        self.change_stream_active = False
+
+    def publish(self, poll: dict):
+        self.dirty[poll["_id"]] = poll
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=POLL_STREAM_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def close_all(self):
+        for queue in list(self.subscribers):
+            self.unsubscribe(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    def broadcast(self):
+        batch, self.dirty = self.dirty, {}
+        if not batch or not self.subscribers:
+            return
+        # Encoded once per tick, shared by every subscriber
+        event = sse_event("polls", encode_json({"polls": list(batch.values())}))
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Drop lagging clients; EventSource reconnects and gets a fresh snapshot
+                self.unsubscribe(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def run_tick_loop(self):
+        while True:
+            await asyncio.sleep(POLL_STREAM_TICK_SECONDS)
+            self.broadcast()
+
+    async def run_change_stream(self):
+        while True:
+            try:
+                async with db.polls.watch(full_document="updateLookup") as stream:
+                    self.change_stream_active = True
+                    async for change in stream:
+                        if change.get("fullDocument"):
+                            self.publish(change["fullDocument"])
+            except OperationFailure as e:
+                logger.info("Poll change stream unavailable, using local updates: %s", e)
+                return
+            except PyMongoError as e:
+                logger.warning("Poll change stream interrupted: %s", e)
+            finally:
+                self.change_stream_active = False
+            await asyncio.sleep(CHANGE_STREAM_RETRY_SECONDS)
+
+poll_stream = PollBroadcaster()
+
+@api_router.get("/polls/stream")
+async def stream_polls():
+    if startup.draining:
+        raise HTTPException(status_code=503, detail="Shutting down", headers={"Retry-After": "1"})
+    queue = poll_stream.subscribe()
     try:
-        result = await db.polls.update_one(
-            {"_id": ObjectId(poll_id)},
-            {"$inc": {vote_request.vote: 1}}
+        snapshot = await load_polls(None)
+    except Exception:
+        poll_stream.unsubscribe(queue)
+        raise
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + POLL_STREAM_MAX_SECONDS
+        try:
+            yield f"retry: {POLL_STREAM_RETRY_MS}\n\n".encode()
+            yield sse_event("snapshot", snapshot)
+            while loop.time() < deadline:
+                timeout = min(POLL_STREAM_HEARTBEAT_SECONDS, deadline - loop.time())
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield event
+        finally:
+            poll_stream.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@api_router.post("/polls/{poll_id}/vote", dependencies=[rate_limit("vote", VOTE_RATE_PER_SECOND, VOTE_BURST)])
+async def vote_poll(poll_id: str, vote_request: VoteRequest, request: Request, lang: Language = None):
+    poll_object_id = parse_object_id(poll_id, "Poll not found")
+    device = device_id(request)
+    dedupe_key = f"{poll_object_id}:{device}"
+    if device and dedupe_key in vote_dedupe:
+        raise HTTPException(status_code=409, detail="Already voted on this poll")
+    poll = await poll_votes.add(poll_object_id, vote_request.vote, state_key(vote_request.state))
+    # Recorded only once the vote is accepted, so a failed attempt can be retried
+    if device:
+        vote_dedupe.add(dedupe_key)
+    return {"success": True, "poll": localize(poll, POLL_FIELDS, lang)}
+
+POLL_HISTORY_WINDOWS = {"minute": timedelta(hours=2), "hour": timedelta(days=2), "day": timedelta(days=90)}
+POLL_HISTORY_STEPS = {"minute": timedelta(minutes=1), "hour": timedelta(hours=1), "day": timedelta(days=1)}
+POLL_HISTORY_MAX_BUCKETS = 1500
+
+def utc_naive(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(tzinfo=None) if moment.tzinfo else moment
+
+@cached("polls")
+async def load_poll_history(poll_id: ObjectId, granularity: str, since: datetime, until: datetime, state: Optional[str]) -> Optional[bytes]:
+    if not await db.polls.find_one({"_id": poll_id}, {"_id": 1}):
+        return None
+    if state:
+        projection = {
+            "_id": 0,
+            "start": 1,
+            "yes": {"$ifNull": [f"$states.{state}.yes", 0]},
+            "no": {"$ifNull": [f"$states.{state}.no", 0]},
+        }
+    else:
+        projection = {"_id": 0, "start": 1, "yes": 1, "no": 1, "states": 1}
+    buckets = await db.poll_vote_buckets.find(
+        {"poll_id": poll_id, "granularity": granularity, "start": {"$gte": since, "$lt": until}},
+        projection,
+    ).sort("start", ASCENDING).to_list(POLL_HISTORY_MAX_BUCKETS)
+    for bucket in buckets:
+        bucket.setdefault("yes", 0)
+        bucket.setdefault("no", 0)
+    return encode_json({
+        "poll_id": str(poll_id),
+        "granularity": granularity,
+        "state": state,
+        "since": since,
+        "until": until,
+        "totals": {option: sum(bucket[option] for bucket in buckets) for option in VOTE_OPTIONS},
+        "buckets": buckets,
+    })
+
+@api_router.get("/polls/{poll_id}/history")
+async def get_poll_history(
+    poll_id: str,
+    request: Request,
+    granularity: Literal["minute", "hour", "day"] = "hour",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    state: Optional[str] = Query(None, max_length=60),
+):
+    poll_object_id = parse_object_id(poll_id, "Poll not found")
+    # The default window ends at the next bucket boundary so it stays cacheable
+    until = utc_naive(until) if until else vote_bucket_starts(datetime.utcnow())[granularity] + POLL_HISTORY_STEPS[granularity]
+    since = utc_naive(since) if since else until - POLL_HISTORY_WINDOWS[granularity]
+    if since >= until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+    if (until - since) / POLL_HISTORY_STEPS[granularity] > POLL_HISTORY_MAX_BUCKETS:
+        # Otherwise the capped read would drop the newest buckets from the totals
+        raise HTTPException(
+            status_code=400,
+            detail=f"Window spans more than {POLL_HISTORY_MAX_BUCKETS} {granularity} buckets; narrow it or use a coarser granularity",
         )
-        if result.modified_count == 0:
+    key = state_key(state)
+
+    async def build():
+        body = await load_poll_history(poll_object_id, granularity, since, until, key)
+        if body is None:
             raise HTTPException(status_code=404, detail="Poll not found")
-        
-        poll = await db.polls.find_one({"_id": ObjectId(poll_id)})
-        poll["_id"] = str(poll["_id"])
-        return {"success": True, "poll": poll}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-@api_router.post("/games/score")
+        return body
+
+    return await conditional_json(
+        request, ("polls",), build,
+        variant=f"history:{poll_id}:{granularity}:{since.isoformat()}:{until.isoformat()}:{key}",
+    )
+
+# Game scores are queued and written with insert_many(ordered=False) once a batch
+# fills up or SCORE_FLUSH_SECONDS passes. A full queue sheds load with a 503.
+SCORE_QUEUE_MAX = int(os.environ.get('SCORE_QUEUE_MAX', '10000'))
+SCORE_BATCH_SIZE = int(os.environ.get('SCORE_BATCH_SIZE', '500'))
+SCORE_FLUSH_SECONDS = float(os.environ.get('SCORE_FLUSH_SECONDS', '1'))
+SCORE_WRITE_ATTEMPTS = 3
+
+class GameScoreIngestor:
+    def __init__(self):
+        self.queue = asyncio.Queue(maxsize=SCORE_QUEUE_MAX)
+        self.in_flight = []
+
+    def submit(self, scores: List[dict]) -> List[ObjectId]:
+        if self.queue.maxsize - self.queue.qsize() < len(scores):
+            raise HTTPException(
+                status_code=503,
+                detail="Score ingestion is busy, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        for score in scores:
+            # Ids are assigned up front so the client gets one before the write lands
+            score["_id"] = ObjectId()
+            self.queue.put_nowait(score)
+        return [score["_id"] for score in scores]
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self.in_flight = [await self.queue.get()]
+            deadline = loop.time() + SCORE_FLUSH_SECONDS
+            while len(self.in_flight) < SCORE_BATCH_SIZE:
+                if not self.queue.empty():
+                    self.in_flight.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self.in_flight.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self.write(self.in_flight)
+            self.in_flight = []
+
+    async def write(self, batch: List[dict], retried: bool = False):
+        for attempt in range(1, SCORE_WRITE_ATTEMPTS + 1):
+            try:
+                await db.game_scores.insert_many(batch, ordered=False)
+                written = batch
+            except BulkWriteError as e:
+                # Duplicate _ids mean an earlier attempt already landed those scores;
+                # they still need their XP credited
+                errors = e.details.get("writeErrors", [])
+                failed = [err for err in errors if err.get("code") != 11000]
+                if failed:
+                    logger.error("Dropped %d game scores: %s", len(failed), failed[0].get("errmsg"))
+                rejected = {err["index"] for err in (failed if retried else errors)}
+                written = [score for index, score in enumerate(batch) if index not in rejected]
+            except PyMongoError as e:
+                retried = True
+                logger.warning("Game score batch write failed (attempt %d): %s", attempt, e)
+                if attempt < SCORE_WRITE_ATTEMPTS:
+                    await asyncio.sleep(attempt)
+                continue
+            await credit_user_xp(written)
+            return
+        logger.error("Dropped %d game scores after %d attempts", len(batch), SCORE_WRITE_ATTEMPTS)
+
+    async def drain(self):
+        # The in-flight batch may have landed before the writer was cancelled
+        batch, self.in_flight = self.in_flight, []
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        for start in range(0, len(batch), SCORE_BATCH_SIZE):
+            await self.write(batch[start:start + SCORE_BATCH_SIZE], retried=True)
+
+score_ingestor = GameScoreIngestor()
+
+async def credit_user_xp(scores: List[dict]):
+    totals = defaultdict(int)
+    for score in scores:
+        if score.get("user_email") and score["user_email"] != GUEST_EMAIL:
+            totals[score["user_email"]] += score["xp_earned"]
+    if not totals:
+        return
+    try:
+        # Only existing users are credited; anonymous score posts never create one.
+        # Nothing in this API creates users yet, so until sign-up lands this
+        # updates no documents and XP lives only in game_scores and the boards.
+        await db.users.bulk_write(
+            [UpdateOne({"email": email}, {"$inc": {"xp": xp}}) for email, xp in totals.items()],
+            ordered=False,
+        )
+    except PyMongoError as e:
+        logger.error("Failed to credit XP for %d users: %s", len(totals), e)
+
+# Leaderboards are kept in memory as sorted (-xp, email) lists, so top-K and rank
+# lookups are O(log n). Every worker tails game_scores by _id to pick up scores
+# written anywhere, and one worker at a time snapshots the boards to Mongo so a
+# restart replays only the scores written since the last snapshot.
+LEADERBOARD_REFRESH_SECONDS = float(os.environ.get('LEADERBOARD_REFRESH_SECONDS', '2'))
+LEADERBOARD_SNAPSHOT_SECONDS = float(os.environ.get('LEADERBOARD_SNAPSHOT_SECONDS', '60'))
+# Score ids are minted before the batched insert, so rescan this far behind the
+# watermark and skip ids already applied
+LEADERBOARD_OVERLAP_SECONDS = 30
+# Entries per snapshot document, well under the 16 MB BSON limit
+LEADERBOARD_SNAPSHOT_CHUNK = 50_000
+LEADERBOARD_DEFAULT_LIMIT = 10
+LEADERBOARD_MAX_LIMIT = 100
+LEADERBOARD_SCORE_PROJECTION = {"user_email": 1, "game_id": 1, "xp_earned": 1, "created_at": 1}
+
+class Leaderboard:
+    def __init__(self):
+        self.totals = {}
+        self.ranking = SortedList()
+
+    def add(self, email: str, xp: int):
+        current = self.totals.get(email)
+        if current is not None:
+            self.ranking.remove((-current, email))
+        total = (current or 0) + xp
+        self.totals[email] = total
+        self.ranking.add((-total, email))
+
+    def rank_of_xp(self, xp: int) -> int:
+        # Competition ranking: players on equal XP share a rank
+        return self.ranking.bisect_left((-xp, "")) + 1
+
+    def top(self, limit: int) -> List[dict]:
+        return [
+            {"rank": self.rank_of_xp(-neg_xp), "player": mask_email(email), "xp": -neg_xp}
+            for neg_xp, email in self.ranking[:limit]
+        ]
+
+    def rank(self, email: str) -> Optional[dict]:
+        xp = self.totals.get(email)
+        if xp is None:
+            return None
+        return {"rank": self.rank_of_xp(xp), "xp": xp, "players": len(self.totals)}
+
+def mask_email(email: str) -> str:
+    name, _, domain = email.partition("@")
+    return f"{name[:2]}***@{domain}" if domain else f"{name[:2]}***"
+
+def leaderboard_periods(moment: datetime):
+    local = moment.replace(tzinfo=timezone.utc).astimezone(IST) if moment.tzinfo is None else moment.astimezone(IST)
+    year, week, _ = local.isocalendar()
+    return f"daily:{local.strftime('%Y-%m-%d')}", f"weekly:{year}-W{week:02d}"
+
+class LeaderboardSet:
+    def __init__(self):
+        self.boards = defaultdict(Leaderboard)
+        self.watermark = None  # generation time of the newest applied score id
+        self.seen = {}  # score _id -> generation time, for the overlap window
+        self.snapshot_lease_owner = str(ObjectId())
+
+    def apply(self, score: dict):
+        email = score.get("user_email")
+        if not email or email == GUEST_EMAIL:
+            return
+        xp = score.get("xp_earned", 0)
+        daily, weekly = leaderboard_periods(score.get("created_at") or score["_id"].generation_time)
+        for key in ("global", f"game:{score['game_id']}", daily, weekly):
+            self.boards[key].add(email, xp)
+
+    def board_key(self, board: str, game_id: Optional[str]) -> str:
+        if board == "game":
+            if not game_id:
+                raise HTTPException(status_code=400, detail="game_id is required for the game board")
+            return f"game:{game_id}"
+        if board in ("daily", "weekly"):
+            daily, weekly = leaderboard_periods(datetime.utcnow())
+            return daily if board == "daily" else weekly
+        return "global"
+
+    def get(self, key: str) -> Leaderboard:
+        return self.boards.get(key) or Leaderboard()
+
+    async def refresh(self):
+        query = {}
+        if self.watermark is not None:
+            since = max(self.watermark - timedelta(seconds=LEADERBOARD_OVERLAP_SECONDS), datetime(1970, 1, 1, tzinfo=timezone.utc))
+            query = {"_id": {"$gt": ObjectId.from_datetime(since)}}
+        async for score in db.game_scores.find(query, LEADERBOARD_SCORE_PROJECTION).sort("_id", 1):
+            if score["_id"] in self.seen:
+                continue
+            self.apply(score)
+            generated = score["_id"].generation_time
+            self.seen[score["_id"]] = generated
+            if self.watermark is None or generated > self.watermark:
+                self.watermark = generated
+        if self.watermark is not None:
+            horizon = self.watermark - timedelta(seconds=LEADERBOARD_OVERLAP_SECONDS)
+            self.seen = {score_id: generated for score_id, generated in self.seen.items() if generated > horizon}
+        self.prune_periods()
+
+    def prune_periods(self):
+        # Keep the current and previous day/week boards only
+        now = datetime.utcnow()
+        keep = set(leaderboard_periods(now)) | set(leaderboard_periods(now - timedelta(days=7)))
+        keep.add(leaderboard_periods(now - timedelta(days=1))[0])
+        for key in [key for key in self.boards if key.startswith(("daily:", "weekly:")) and key not in keep]:
+            del self.boards[key]
+
+    async def load_snapshot(self):
+        # Startup retries call this again, so always start over from empty boards
+        self.boards = defaultdict(Leaderboard)
+        self.watermark = None
+        self.seen = {}
+        meta = await db.leaderboard_snapshots.find_one({"_id": "_meta"})
+        if not meta:
+            return
+        boards = await db.leaderboard_snapshots.find(
+            {"_id": {"$nin": ["_meta", "_lease"]}, "snapshot": meta["snapshot"]}
+        ).to_list(None)
+        if len(boards) != meta.get("documents", meta.get("boards")):
+            logger.warning("Incomplete leaderboard snapshot, rebuilding from game_scores")
+            return
+        loaded = defaultdict(Leaderboard)
+        for doc in boards:
+            board = loaded[doc.get("board", doc["_id"])]
+            for email, xp in doc["entries"]:
+                board.add(email, xp)
+        self.boards = loaded
+        self.watermark = meta["watermark"].replace(tzinfo=timezone.utc)
+        self.seen = {score_id: score_id.generation_time for score_id in meta["recent_ids"]}
+
+    async def save_snapshot(self):
+        # Lease so that only one worker writes each snapshot interval
+        if not await acquire_lease(
+            db.leaderboard_snapshots, "_lease", self.snapshot_lease_owner, LEADERBOARD_SNAPSHOT_SECONDS
+        ):
+            return
+        if self.watermark is None:
+            return
+        now = datetime.utcnow()
+        snapshot = str(ObjectId())
+        requests = []
+        for key, board in list(self.boards.items()):
+            entries = list(board.totals.items())
+            for chunk, start in enumerate(range(0, max(len(entries), 1), LEADERBOARD_SNAPSHOT_CHUNK)):
+                requests.append(UpdateOne(
+                    {"_id": {"board": key, "chunk": chunk}},
+                    {"$set": {"board": key, "snapshot": snapshot, "entries": entries[start:start + LEADERBOARD_SNAPSHOT_CHUNK]}},
+                    upsert=True,
+                ))
+        if requests:
+            await db.leaderboard_snapshots.bulk_write(requests, ordered=False)
+        await db.leaderboard_snapshots.replace_one(
+            {"_id": "_meta"},
+            {"snapshot": snapshot, "documents": len(requests), "watermark": self.watermark, "recent_ids": list(self.seen), "saved_at": now},
+            upsert=True,
+        )
+        await db.leaderboard_snapshots.delete_many({"_id": {"$nin": ["_meta", "_lease"]}, "snapshot": {"$ne": snapshot}})
+
+    async def run_refresh_loop(self):
+        loop = asyncio.get_running_loop()
+        next_snapshot = loop.time() + LEADERBOARD_SNAPSHOT_SECONDS
+        while True:
+            try:
+                await self.refresh()
+                if loop.time() >= next_snapshot:
+                    next_snapshot = loop.time() + LEADERBOARD_SNAPSHOT_SECONDS
+                    await self.save_snapshot()
+            except Exception:
+                logger.exception("Leaderboard refresh failed")
+            await asyncio.sleep(LEADERBOARD_REFRESH_SECONDS)
+
+leaderboards = LeaderboardSet()
+
+@api_router.get("/leaderboard")
+async def get_leaderboard(
+    board: Literal["global", "game", "daily", "weekly"] = "global",
+    game_id: Optional[str] = None,
+    limit: int = Query(LEADERBOARD_DEFAULT_LIMIT, ge=1, le=LEADERBOARD_MAX_LIMIT),
+):
+    key = leaderboards.board_key(board, game_id)
+    leaderboard = leaderboards.get(key)
+    return {"board": key, "players": len(leaderboard.totals), "entries": leaderboard.top(limit)}
+
+@api_router.get("/users/{email}/rank")
+async def get_user_rank(
+    email: str,
+    board: Literal["global", "game", "daily", "weekly"] = "global",
+    game_id: Optional[str] = None,
+):
+    key = leaderboards.board_key(board, game_id)
+    rank = leaderboards.get(key).rank(email)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="No scores on this leaderboard yet")
+    return {"board": key, "email": email, **rank}
+
+@api_router.post("/games/score", dependencies=[rate_limit("score", SCORE_RATE_PER_SECOND, SCORE_BURST)])
 async def submit_game_score(score: GameScore):
-    score_dict = score.dict()
-    result = await db.game_scores.insert_one(score_dict)
-    return {"success": True, "id": str(result.inserted_id), "xp_earned": score.xp_earned}
+    [score_id] = score_ingestor.submit([score.dict()])
+    return {"success": True, "id": str(score_id), "xp_earned": score.xp_earned}
 
-@api_router.get("/quotes/today")
-async def get_today_quote():
-    quote = await db.quotes.find_one()
+@api_router.post("/games/scores", dependencies=[rate_limit("scores", SCORE_BATCH_RATE_PER_SECOND, SCORE_BATCH_BURST)])
+async def submit_game_scores(batch: GameScoreBatch):
+    # For clients flushing scores recorded while offline
+    score_ids = score_ingestor.submit([score.dict() for score in batch.scores])
+    return {
+        "success": True,
+        "ids": [str(score_id) for score_id in score_ids],
+        "xp_earned": sum(score.xp_earned for score in batch.scores),
+    }
+
+# Quote of the day: a quote whose date matches wins, otherwise quote_schedule
+# (keyed by day) assigns undated quotes round-robin QUOTE_SCHEDULE_DAYS ahead.
+# Each worker caches the day's quote until IST midnight.
+QUOTE_SCHEDULE_DAYS = 30
+DEFAULT_QUOTE = {
+    "quote_en": "Swadeshi Soch. Swadeshi Rashtra.",
+    "quote_hi": "स्वदेशी सोच। स्वदेशी राष्ट्र।",
+    "author_en": "Swadeshi Hind",
+    "author_hi": "स्वदेशी हिन्द",
+}
+
+def ist_now() -> datetime:
+    return datetime.now(IST)
+
+def seconds_until_ist_midnight() -> float:
+    now = ist_now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=IST)
+    return (midnight - now).total_seconds()
+
+async def schedule_quotes(days: int = QUOTE_SCHEDULE_DAYS):
+    pool = [quote["_id"] for quote in await db.quotes.find({}, {"_id": 1}).sort("_id", 1).to_list(None)]
+    if not pool:
+        return
+    today = ist_now().date()
+    dates = [(today + timedelta(days=offset)).isoformat() for offset in range(days)]
+    pinned = set(await db.quotes.distinct("date", {"date": {"$in": dates}}))
+    scheduled = {entry["_id"] async for entry in db.quote_schedule.find({"_id": {"$in": dates}}, {"_id": 1})}
+    last = await db.quote_schedule.find_one(sort=[("_id", -1)])
+    position = pool.index(last["quote_id"]) + 1 if last and last["quote_id"] in pool else 0
+    updates = []
+    for day in dates:
+        if day in pinned or day in scheduled:
+            continue
+        updates.append(UpdateOne({"_id": day}, {"$setOnInsert": {"quote_id": pool[position % len(pool)]}}, upsert=True))
+        position += 1
+    if updates:
+        # $setOnInsert keeps whichever worker scheduled a day first
+        await db.quote_schedule.bulk_write(updates, ordered=False)
+
+async def run_quote_scheduler():
+    while True:
+        await asyncio.sleep(seconds_until_ist_midnight() + 1)
+        try:
+            await schedule_quotes()
+        except Exception:
+            logger.exception("Quote scheduling failed")
+
+QUOTE_PROJECTION = {"date": 1}
+QUOTE_FIELDS = ("quote", "author")
+
+async def find_quote_for_date(day: str, projection: Optional[dict] = None) -> Optional[dict]:
+    quote = await db.quotes.find_one({"date": day}, projection)
     if quote:
-        quote["_id"] = str(quote["_id"])
         return quote
-    return {"quote_en": "Swadeshi Soch. Swadeshi Rashtra.", "quote_hi": "स्वदेशी सोच। स्वदेशी राष्ट्र।", "author_en": "Swadeshi Hind", "author_hi": "स्वदेशी हिन्द"}
+    entry = await db.quote_schedule.find_one({"_id": day})
+    if entry:
+        quote = await db.quotes.find_one({"_id": entry["quote_id"]}, projection)
+        if quote:
+            return quote
+        # Scheduled quote was deleted before the day was rescheduled: next in rotation
+        return await db.quotes.find_one({"_id": {"$gt": entry["quote_id"]}}, projection, sort=[("_id", 1)]) \
+            or await db.quotes.find_one({}, projection, sort=[("_id", 1)])
+    return None
+
+@cached("quotes", ttl=seconds_until_ist_midnight)
+async def load_quote_of_the_day(day: str, lang: Language) -> bytes:
+    quote = await find_quote_for_date(day, localized_projection(QUOTE_PROJECTION, QUOTE_FIELDS, lang))
+    return encode_json(quote or localize(DEFAULT_QUOTE, QUOTE_FIELDS, lang))
+
+@api_router.get("/quotes/today")
+async def get_today_quote(request: Request, lang: Language = None):
+    today = ist_now().date().isoformat()
+    return await conditional_json(
+        request, ("quotes",), lambda: load_quote_of_the_day(today, lang), variant=f"{today}:{lang}"
+    )
+
+@api_router.post("/quotes", dependencies=[Depends(require_admin)])
+async def create_quote(quote: Quote):
+    result = await db.quotes.insert_one({**quote.dict(), "updated_at": datetime.utcnow()})
+    await resource_changed("quotes")
+    return {"success": True, "id": str(result.inserted_id)}
 
-@api_router.post("/volunteer")
+@api_router.delete("/quotes/{quote_id}", dependencies=[Depends(require_admin)])
+async def delete_quote(quote_id: str):
+    quote_object_id = parse_object_id(quote_id, "Quote not found")
+    await delete_with_tombstone("quotes", quote_object_id, "Quote not found")
+    # Days it was scheduled for from today on get the rotation again
+    await db.quote_schedule.delete_many({"quote_id": quote_object_id, "_id": {"$gte": ist_now().date().isoformat()}})
+    await schedule_quotes()
+    await resource_changed("quotes")
+    return {"success": True}
+
+# Offline sync: the app keeps a local copy and asks for what changed since its
+# last watermark. Every write to news, polls and quotes stamps updated_at (see
+# the updated_at indexes) and deletions leave a tombstone, so a sync reads only
+# the delta. The returned watermark trails the server clock by SYNC_SKEW_SECONDS
+# to cover in-flight writes and clock skew between workers; clients apply the
+# results as upserts by _id, so the overlap is harmless. The watermark is an
+# opaque token: a timestamp, plus the collection and _id of the last change
+# sent when a page was cut at SYNC_LIMIT.
+SYNC_SKEW_SECONDS = float(os.environ.get('SYNC_SKEW_SECONDS', '10'))
+SYNC_LIMIT = int(os.environ.get('SYNC_LIMIT', '500'))
+SYNC_TOMBSTONE_DAYS = float(os.environ.get('SYNC_TOMBSTONE_DAYS', '30'))
+SYNC_COLLECTIONS = {
+    "news": (NEWS_PROJECTION, NEWS_DETAIL_FIELDS),
+    "polls": (POLL_PROJECTION, POLL_FIELDS),
+    "quotes": (QUOTE_PROJECTION, QUOTE_FIELDS),
+}
+
+async def backfill_updated_at():
+    # Documents written before updated_at existed count as changed when created
+    for collection in SYNC_COLLECTIONS:
+        await db[collection].update_many(
+            {"updated_at": {"$exists": False}},
+            [{"$set": {"updated_at": {"$ifNull": ["$created_at", {"$toDate": "$_id"}]}}}],
+        )
+
+async def delete_with_tombstone(collection: str, doc_id: ObjectId, detail: str):
+    result = await db[collection].delete_one({"_id": doc_id})
+    if not result.deleted_count:
+        raise HTTPException(status_code=404, detail=detail)
+    now = datetime.utcnow()
+    await db.tombstones.insert_one({
+        "collection": collection,
+        "doc_id": doc_id,
+        "deleted_at": now,
+        "expires_at": now + timedelta(days=SYNC_TOMBSTONE_DAYS),
+    })
+    await resource_changed(collection)
+
+def encode_sync_token(updated_at: datetime, collection: Optional[str] = None, doc_id: Optional[ObjectId] = None) -> str:
+    if collection is None:
+        return updated_at.isoformat()
+    return f"{updated_at.isoformat()},{collection},{doc_id}"
+
+def decode_sync_token(token: str) -> Tuple[datetime, Optional[str], Optional[ObjectId]]:
+    # A plain timestamp, or "timestamp,collection,_id" when the last page was truncated
+    try:
+        updated_at, _, position = token.partition(",")
+        updated_at = utc_naive(datetime.fromisoformat(updated_at))
+        if not position:
+            return updated_at, None, None
+        collection, _, doc_id = position.partition(",")
+        if collection not in SYNC_COLLECTIONS:
+            raise ValueError(collection)
+        return updated_at, collection, ObjectId(doc_id)
+    except (ValueError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+
+def sync_query(since: Optional[datetime], after_id: Optional[ObjectId]) -> dict:
+    if not since:
+        return {}
+    if after_id is None:
+        return {"updated_at": {"$gte": since}}
+    # Keyset condition matching the (updated_at, _id) sort, so a page boundary
+    # inside a run of equal timestamps still moves forward
+    return {
+        "$or": [
+            {"updated_at": {"$gt": since}},
+            {"updated_at": since, "_id": {"$gt": after_id}},
+        ]
+    }
+
+async def sync_changes(collection: str, since: Optional[datetime], after_id: Optional[ObjectId], lang: Language):
+    base, fields = SYNC_COLLECTIONS[collection]
+    docs = await db[collection].find(sync_query(since, after_id), localized_projection({**base, "updated_at": 1}, fields, lang)) \
+        .sort([("updated_at", ASCENDING), ("_id", ASCENDING)]).limit(SYNC_LIMIT + 1).to_list(SYNC_LIMIT + 1)
+    return docs[:SYNC_LIMIT], len(docs) > SYNC_LIMIT
+
+@api_router.get("/sync")
+async def sync(since: Optional[str] = None, lang: Language = None):
+    now = datetime.utcnow()
+    since, resume_collection, resume_id = decode_sync_token(since) if since else (None, None, None)
+    # Tombstones older than the retention are gone, so such clients start over
+    reset = bool(since and since < now - timedelta(days=SYNC_TOMBSTONE_DAYS))
+    if reset:
+        since = resume_collection = None
+    watermark = encode_sync_token(now - timedelta(seconds=SYNC_SKEW_SECONDS))
+    results = await asyncio.gather(*(
+        sync_changes(collection, since, resume_id if collection == resume_collection else None, lang)
+        for collection in SYNC_COLLECTIONS
+    ))
+    payload = {"reset": reset, "complete": True}
+    resume = None
+    for collection, (docs, truncated) in zip(SYNC_COLLECTIONS, results):
+        payload[collection] = docs
+        if truncated:
+            payload["complete"] = False
+            if resume is None or docs[-1]["updated_at"] < resume[0]:
+                resume = (docs[-1]["updated_at"], collection, docs[-1]["_id"])
+    if resume and resume[0] < now - timedelta(seconds=SYNC_SKEW_SECONDS):
+        # Resume after the last returned change of the furthest-behind collection;
+        # the others restart at that timestamp and re-send a harmless overlap
+        watermark = encode_sync_token(*resume)
+    deleted = {collection: [] for collection in SYNC_COLLECTIONS}
+    if since:
+        tombstones = await db.tombstones.find(
+            {"deleted_at": {"$gte": since}}, {"_id": 0, "collection": 1, "doc_id": 1}
+        ).to_list(None)
+        for tombstone in tombstones:
+            deleted.setdefault(tombstone["collection"], []).append(tombstone["doc_id"])
+    payload["deleted"] = deleted
+    # Upcoming rotation, so the app can show the quote of the day while offline
+    today = ist_now().date().isoformat()
+    payload["quote_schedule"] = [
+        {"date": entry["_id"], "quote_id": entry["quote_id"]}
+        async for entry in db.quote_schedule.find({"_id": {"$gte": today}}).sort("_id", ASCENDING).limit(QUOTE_SCHEDULE_DAYS)
+    ]
+    payload["watermark"] = watermark
+    return json_bytes_response(encode_json(payload), headers={"Cache-Control": "no-store"})
+
+@api_router.get("/volunteers/export", dependencies=[Depends(require_admin)])
+async def export_volunteers(format: ExportFormat = None):
+    return export_response(db.volunteers.find({}).sort("_id", ASCENDING), format, filename="volunteers")
+
+@api_router.post(
+    "/volunteer",
+    dependencies=[rate_limit("volunteer", VOLUNTEER_RATE_PER_SECOND, VOLUNTEER_BURST)],
+)
 async def submit_volunteer_form(form: VolunteerForm):
-    form_dict = form.dict()
+    # Stored normalised so the indexed lookups below match however it was typed
+    form.email = form.email.strip().lower()
+    phone_digits = re.sub(r"\D", "", form.phone)
+    keys = {"email": "email:" + form.email}
+    if phone_digits:
+        keys["phone_digits"] = "phone:" + phone_digits
+    seen = [field for field, key in keys.items() if key in volunteer_dedupe]
+    if seen:
+        # A Bloom match may be a false positive; the indexes decide
+        values = {"email": form.email, "phone_digits": phone_digits}
+        existing = await db.volunteers.find_one({"$or": [{field: values[field]} for field in seen]}, {"_id": 1})
+        if existing:
+            # Retries of an accepted sign-up get the same answer without another insert
+            return {"success": True, "message": "Thank you for volunteering!", "id": str(existing["_id"]), "duplicate": True}
+    form_dict = {**form.dict(), "phone_digits": phone_digits}
     result = await db.volunteers.insert_one(form_dict)
+    for key in keys.values():
+        volunteer_dedupe.add(key)
     return {"success": True, "message": "Thank you for volunteering!", "id": str(result.inserted_id)}
 
-# Include router
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Graceful drain. uvicorn only runs the lifespan shutdown after every open
+# connection has finished, so readiness and the SSE streams are handled as soon
+# as SIGTERM/SIGINT arrives: readiness fails and open streams end (EventSource
+# reconnects elsewhere), letting uvicorn get to the shutdown below, which stops
+# the loops and flushes buffered writes before the client closes.
+GRACEFUL_SHUTDOWN_SECONDS = float(os.environ.get('GRACEFUL_SHUTDOWN_SECONDS', '20'))
+
+def begin_drain():
+    if startup.draining:
+        return
+    logger.info("Worker %s draining", startup.owner)
+    startup.draining = True
+    startup.ready = False
+    poll_stream.close_all()
+
+def install_drain_signal_handlers():
+    if threading.current_thread() is not threading.main_thread():
+        return  # signals can only be handled on the main thread
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        # Chained in front of the server's handler; an asyncio loop handler
+        # still fires through the loop's wakeup fd
+        previous = signal.getsignal(sig)
+
+        def handler(signum, frame, previous=previous):
+            loop.call_soon_threadsafe(begin_drain)
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(sig, handler)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    connect_mongo()
+    install_drain_signal_handlers()
+    start_background_work()
+    yield
+    begin_drain()  # no-op when a signal already started it
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+    await poll_votes.flush()
+    await score_ingestor.drain()
+    try:
+        await leaderboards.save_snapshot()
+    except PyMongoError as e:
+        logger.warning("Skipped leaderboard snapshot on shutdown: %s", e)
+    client.close()
+
+# Create the main app
+app = FastAPI(lifespan=lifespan)
 app.include_router(api_router)
 
 app.add_middleware(
@@ -201,13 +2226,24 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+if __name__ == "__main__":
+    # Multi-process serving: python server.py, with WEB_CONCURRENCY workers
+    # (default one per CPU this process may run on). Each worker opens its own
+    # Mongo pool, warms its caches before /api/health/ready passes and drains
+    # on SIGTERM. In containers with a CPU quota set WEB_CONCURRENCY to match.
+    import uvicorn
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    sys.path.insert(0, str(ROOT_DIR))
+    usable_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    uvicorn.run(
+        "server:app",
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', '8001')),
+        workers=int(os.environ.get('WEB_CONCURRENCY') or usable_cpus or 1),
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+        proxy_headers=True,
+        log_level="info",
+    )
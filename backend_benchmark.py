@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Load benchmarks for the Swadeshi Hind backend
+Starts backend/server.py under uvicorn against a local mongod, drives a weighted
+mix of realistic requests with an async load generator and reports throughput
+and latency percentiles as JSON that can be compared between commits
+
+    python backend_benchmark.py run --profile mixed --output bench.json
+    python backend_benchmark.py run --profile votes --workers 1,2,4
+    python backend_benchmark.py run --profile reads --workers scale
+    python backend_benchmark.py compare baseline.json bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+from bson import ObjectId
+from pymongo import MongoClient
+
+ROOT_DIR = Path(__file__).parent
+BACKEND_DIR = ROOT_DIR / "backend"
+DEFAULT_MONGO_URL = "mongodb://localhost:27017"
+# Every virtual user shares one address, so lift the per-client write limits
+SERVER_ENV = {"VOTE_BURST": "1000000000", "VOLUNTEER_BURST": "1000000000", "SCORE_BURST": "1000000000"}
+
+# Operation weights per profile; each virtual user picks its next request from these
+PROFILES = {
+    "mixed": {"feed": 40, "feed_revalidate": 15, "feed_next_page": 8, "article": 7, "polls": 10,
+              "quote": 5, "vote": 8, "score": 5, "volunteer": 2},
+    "reads": {"feed": 50, "feed_revalidate": 20, "feed_next_page": 10, "article": 10, "polls": 5, "quote": 5},
+    "rally": {"feed": 20, "feed_revalidate": 10, "polls": 10, "poll_history": 5, "vote": 50, "score": 8, "volunteer": 2},
+    "offline": {"sync": 60, "vote": 30, "polls": 10},
+    "votes": {"vote": 100},
+    "scores": {"score": 100},
+}
+
+BENCH_STATES = ["Uttar Pradesh", "Maharashtra", "Bihar", "Delhi", "Tamil Nadu", None]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """Throughput and latency percentiles (milliseconds) for one run"""
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+    }
+
+
+class MongodProcess:
+    """Throwaway mongod on a free port, for CI machines without a running one"""
+
+    def __init__(self):
+        self.port = free_port()
+        self.url = f"mongodb://127.0.0.1:{self.port}"
+        self.dbpath = None
+        self.process = None
+
+    def __enter__(self):
+        if not shutil.which("mongod"):
+            raise RuntimeError("--spawn-mongod needs a mongod binary on PATH")
+        self.dbpath = tempfile.mkdtemp(prefix="bench-mongod-")
+        self.process = subprocess.Popen(
+            ["mongod", "--dbpath", self.dbpath, "--port", str(self.port), "--bind_ip", "127.0.0.1", "--quiet"],
+            stdout=subprocess.DEVNULL,
+        )
+        client = MongoClient(self.url, serverSelectionTimeoutMS=30000)
+        client.admin.command("ping")
+        client.close()
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+        shutil.rmtree(self.dbpath, ignore_errors=True)
+
+
+class ServerProcess:
+    """Runs backend/server.py under uvicorn on a free local port"""
+
+    def __init__(self, mongo_url, db_name, workers=1, env=None):
+        self.port = free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}/api"
+        self.workers = workers
+        self.env = {**os.environ, **SERVER_ENV, "MONGO_URL": mongo_url, "DB_NAME": db_name, **(env or {})}
+        self.process = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "server:app",
+                "--app-dir", str(BACKEND_DIR),
+                "--host", "127.0.0.1",
+                "--port", str(self.port),
+                "--workers", str(self.workers),
+                "--log-level", "warning",
+                "--timeout-graceful-shutdown", "20",
+            ],
+            env=self.env,
+        )
+        # Each worker warms up on its own; require a run of ready answers on fresh
+        # connections so that every worker has most likely been seen ready
+        deadline = time.time() + 60
+        streak = 0
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self.process.returncode}")
+            try:
+                ready = httpx.get(f"{self.base_url}/health/ready", timeout=1).status_code == 200
+            except httpx.HTTPError:
+                ready = False
+            streak = streak + 1 if ready else 0
+            if streak >= 4 * self.workers:
+                return self
+            time.sleep(0.05 if ready else 0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError("Server did not become ready in 60s")
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def seed_database(mongo_url, db_name, news_count):
+    """Fills news before the server starts so the feed pages over realistic data"""
+    db = MongoClient(mongo_url)[db_name]
+    now = datetime.utcnow()
+    words = "Swadeshi growth India policy rural digital infrastructure energy farmers youth".split()
+    rng = random.Random(7)
+    db.news.insert_many([
+        {
+            "title_en": " ".join(rng.choices(words, k=8)),
+            "title_hi": "भारत की प्रगति " + str(index),
+            "summary_en": " ".join(rng.choices(words, k=30)),
+            "summary_hi": "स्वदेशी सोच। स्वदेशी राष्ट्र। " * 4,
+            "content_en": " ".join(rng.choices(words, k=300)),
+            "content_hi": "भारत की अर्थव्यवस्था मजबूत वृद्धि दिखाती है। " * 30,
+            "truth_score": round(rng.random(), 2),
+            "source": rng.choice(["PIB", "Ministry of Finance", "MEITY", "RBI"]),
+            "fact_vs_claim_en": "Fact: verified by official data.",
+            "fact_vs_claim_hi": "तथ्य: आधिकारिक डेटा द्वारा सत्यापित।",
+            "created_at": now - timedelta(minutes=index),
+        }
+        for index in range(news_count)
+    ])
+
+
+class Workload:
+    """The request mix; one instance per run shares discovered ids and ETags"""
+
+    def __init__(self, weights, seed):
+        self.operations = list(weights)
+        self.weights = [weights[name] for name in self.operations]
+        self.rng = random.Random(seed)
+        self.poll_id = None
+        self.article_ids = []
+        self.next_cursor = None
+        self.feed_etag = None
+        self.sync_watermark = None
+
+    async def prepare(self, client):
+        polls = (await client.get("/polls")).json()["polls"]
+        self.poll_id = polls[0]["_id"]
+        page = await client.get("/news", params={"limit": 20})
+        self.feed_etag = page.headers.get("etag")
+        body = page.json()
+        self.article_ids = [article["_id"] for article in body["news"]]
+        self.next_cursor = body["next_cursor"]
+        self.sync_watermark = (await client.get("/sync")).json()["watermark"]
+
+    def pick(self):
+        return self.rng.choices(self.operations, self.weights)[0]
+
+    async def request(self, client, operation, user):
+        if operation == "feed":
+            return await client.get("/news", params={"limit": 20})
+        if operation == "feed_revalidate":
+            return await client.get("/news", params={"limit": 20}, headers={"If-None-Match": self.feed_etag or ""})
+        if operation == "feed_next_page":
+            return await client.get("/news", params={"limit": 20, "after": self.next_cursor or ""})
+        if operation == "article":
+            return await client.get(f"/news/{self.rng.choice(self.article_ids)}")
+        if operation == "polls":
+            return await client.get("/polls")
+        if operation == "quote":
+            return await client.get("/quotes/today")
+        if operation == "poll_history":
+            return await client.get(f"/polls/{self.poll_id}/history", params={"granularity": "minute"})
+        if operation == "sync":
+            # A returning client catching up on the changes since its last sync
+            return await client.get("/sync", params={"since": self.sync_watermark}, headers={"Accept-Encoding": "gzip"})
+        if operation == "vote":
+            return await client.post(
+                f"/polls/{self.poll_id}/vote",
+                json={"vote": self.rng.choice(["yes", "no"]), "state": self.rng.choice(BENCH_STATES)},
+                headers={"X-Device-Id": f"bench-{user}-{self.rng.random()}"},
+            )
+        if operation == "score":
+            return await client.post("/games/score", json={
+                "user_email": f"bench{user}@example.com",
+                "game_id": self.rng.choice(["quiz", "memory", "puzzle"]),
+                "score": self.rng.randint(0, 100),
+                "xp_earned": self.rng.randint(1, 20),
+            })
+        if operation == "volunteer":
+            unique = ObjectId()
+            return await client.post("/volunteer", json={
+                "name": "Bench Volunteer",
+                "email": f"volunteer-{unique}@example.com",
+                "phone": str(int(str(unique), 16))[-10:],
+                "state": "Maharashtra",
+                "message": "Benchmark sign-up",
+            }, headers={"X-Device-Id": f"bench-{user}"})
+        raise ValueError(f"Unknown operation {operation}")
+
+
+async def drive(base_url, workload, concurrency, duration, warmup):
+    """Runs the workload from `concurrency` virtual users; warmup requests are not recorded"""
+    latencies = {name: [] for name in workload.operations}
+    errors = {name: 0 for name in workload.operations}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        await workload.prepare(client)
+        loop_started = time.perf_counter()
+        measure_from = loop_started + warmup
+        deadline = measure_from + duration
+
+        async def user(index):
+            while time.perf_counter() < deadline:
+                operation = workload.pick()
+                started = time.perf_counter()
+                try:
+                    response = await workload.request(client, operation, index)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+                if started < measure_from:
+                    continue
+                if failed:
+                    errors[operation] += 1
+                else:
+                    latencies[operation].append(time.perf_counter() - started)
+
+        await asyncio.gather(*(user(index) for index in range(concurrency)))
+    elapsed = duration
+    operations = {
+        name: summarize(latencies[name], errors[name], elapsed) for name in workload.operations
+    }
+    overall = summarize([value for values in latencies.values() for value in values], sum(errors.values()), elapsed)
+    return overall, operations
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_profile(args, mongo_url):
+    mongo = MongoClient(mongo_url)
+    results = []
+    for workers in args.workers:
+        db_name = f"bench_{args.profile}_{int(time.time())}_{workers}"
+        try:
+            seed_database(mongo_url, db_name, args.news)
+            with ServerProcess(mongo_url, db_name, workers=workers, env=args.server_env) as server:
+                workload = Workload(PROFILES[args.profile], args.seed)
+                overall, operations = asyncio.run(
+                    drive(server.base_url, workload, args.concurrency, args.duration, args.warmup)
+                )
+                poll_id = workload.poll_id
+            result = {"workers": workers, **overall, "operations": operations}
+            if "vote" in operations:
+                # Buffered votes are flushed on shutdown, so the tally is final here
+                poll = mongo[db_name].polls.find_one({"_id": ObjectId(poll_id)})
+                result["persisted_votes"] = poll["yes"] + poll["no"]
+            results.append(result)
+            print(f"{args.profile} workers={workers}: {overall['throughput_rps']} req/s, "
+                  f"p95 {overall['p95_ms']} ms, p99 {overall['p99_ms']} ms, errors {overall['errors']}",
+                  file=sys.stderr)
+        finally:
+            mongo.drop_database(db_name)
+    return results
+
+
+def parse_workers(value):
+    """Comma-separated worker counts, or "scale" for 1, 2, 4, ... up to the core count"""
+    if value != "scale":
+        return [int(n) for n in value.split(",")]
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def scaling(results):
+    base = results[0]["throughput_rps"] if results and results[0]["workers"] == 1 else None
+    if not base:
+        return None
+    return [
+        {"workers": run["workers"],
+         "speedup": round(run["throughput_rps"] / base, 2),
+         "efficiency": round(run["throughput_rps"] / base / run["workers"], 2)}
+        for run in results
+    ]
+
+
+def command_run(args):
+    if args.spawn_mongod:
+        with MongodProcess() as mongod:
+            results = run_profile(args, mongod.url)
+    else:
+        results = run_profile(args, args.mongo_url)
+    report = {
+        "profile": args.profile,
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "warmup_s": args.warmup,
+        "news": args.news,
+        "seed": args.seed,
+        "results": results,
+    }
+    if len(results) > 1:
+        report["scaling"] = scaling(results)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+def command_compare(args):
+    """Exits non-zero when throughput drops or p95 rises by more than the threshold"""
+    baseline = json.loads(Path(args.baseline).read_text())
+    candidate = json.loads(Path(args.candidate).read_text())
+    baseline_runs = {run["workers"]: run for run in baseline["results"]}
+    regressions = []
+    rows = []
+    for run in candidate["results"]:
+        before = baseline_runs.get(run["workers"])
+        if not before:
+            continue
+        for name, after_stats in {"overall": run, **run["operations"]}.items():
+            before_stats = before if name == "overall" else before["operations"].get(name)
+            if not before_stats or not before_stats["requests"] or not after_stats["requests"]:
+                continue
+            throughput = after_stats["throughput_rps"] / before_stats["throughput_rps"] - 1
+            p95 = after_stats["p95_ms"] / before_stats["p95_ms"] - 1 if before_stats["p95_ms"] else 0.0
+            row = {"workers": run["workers"], "operation": name,
+                   "throughput_change": round(throughput, 3), "p95_change": round(p95, 3)}
+            rows.append(row)
+            if throughput < -args.threshold or p95 > args.threshold:
+                regressions.append(row)
+    print(json.dumps({
+        "baseline": baseline.get("revision"),
+        "candidate": candidate.get("revision"),
+        "threshold": args.threshold,
+        "changes": rows,
+        "regressions": regressions,
+    }, indent=2))
+    sys.exit(1 if regressions else 0)
+
+
+def parse_env(values):
+    return dict(value.split("=", 1) for value in values or [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="benchmark one profile, optionally over several worker counts")
+    run.add_argument("--profile", choices=sorted(PROFILES), default="mixed")
+    run.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", DEFAULT_MONGO_URL))
+    run.add_argument("--spawn-mongod", action="store_true", help="start a throwaway mongod instead of using --mongo-url")
+    run.add_argument("--workers", default="1", type=parse_workers,
+                     help='comma-separated uvicorn worker counts, or "scale" for powers of two up to the core count')
+    run.add_argument("--concurrency", type=int, default=64)
+    run.add_argument("--duration", type=float, default=20.0)
+    run.add_argument("--warmup", type=float, default=3.0)
+    run.add_argument("--news", type=int, default=500, help="articles seeded before the run")
+    run.add_argument("--seed", type=int, default=1, help="seed for the request mix")
+    run.add_argument("--server-env", action="append", type=str, metavar="KEY=VALUE",
+                     help="extra environment for the server, repeatable")
+    run.add_argument("--output", help="write the JSON report here instead of stdout")
+
+    compare = commands.add_parser("compare", help="compare two reports from `run`")
+    compare.add_argument("baseline")
+    compare.add_argument("candidate")
+    compare.add_argument("--threshold", type=float, default=0.10, help="allowed relative change, default 10%%")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        args.server_env = parse_env(args.server_env)
+        command_run(args)
+    else:
+        command_compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -74,7 +74,7 @@ class BackendTester:
                 
                 # Validate first article structure
                 article = news_articles[0]
-                required_fields = ["title_en", "title_hi", "summary_en", "summary_hi", "image_base64", "truth_score", "source"]
+                required_fields = ["title_en", "title_hi", "summary_en", "summary_hi", "image_url", "truth_score", "source"]
                 missing_fields = [field for field in required_fields if field not in article]
                 
                 if missing_fields:
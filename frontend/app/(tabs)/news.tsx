@@ -3,6 +3,7 @@ import {
   View,
   Text,
   ScrollView,
+  FlatList,
   TouchableOpacity,
   StyleSheet,
   RefreshControl,
@@ -22,9 +23,7 @@ interface NewsArticle {
   title_hi: string;
   summary_en: string;
   summary_hi: string;
-  content_en: string;
-  content_hi: string;
-  image_base64: string;
+  image_url: string | null;
   truth_score: number;
   source: string;
   fact_vs_claim_en: string;
@@ -36,6 +35,8 @@ export default function NewsScreen() {
   const { language, toggleLanguage } = useLanguage();
   const isDark = theme === 'dark';
   const [news, setNews] = useState<NewsArticle[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [refreshing, setRefreshing] = useState(false);
   const [selectedArticle, setSelectedArticle] = useState<NewsArticle | null>(null);
   const [showFactModal, setShowFactModal] = useState(false);
@@ -49,11 +50,27 @@ export default function NewsScreen() {
       const response = await fetch(`${BACKEND_URL}/api/news`);
       const data = await response.json();
       setNews(data.news || []);
+      setNextCursor(data.next_cursor || null);
     } catch (error) {
       console.error('Failed to fetch news:', error);
     }
   };
 
+  const fetchMoreNews = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const response = await fetch(`${BACKEND_URL}/api/news?after=${encodeURIComponent(nextCursor)}`);
+      const data = await response.json();
+      setNews((current) => [...current, ...(data.news || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (error) {
+      console.error('Failed to fetch more news:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const onRefresh = async () => {
     setRefreshing(true);
     await fetchNews();
@@ -77,15 +94,17 @@ export default function NewsScreen() {
         </TouchableOpacity>
       </View>
 
-      <ScrollView
+      <FlatList
+        data={news}
+        keyExtractor={(article) => article._id}
         showsVerticalScrollIndicator={false}
         refreshControl={
           <RefreshControl refreshing={refreshing} onRefresh={onRefresh} />
         }
-      >
-        {news.map((article) => (
+        onEndReached={fetchMoreNews}
+        onEndReachedThreshold={0.5}
+        renderItem={({ item: article }) => (
           <TouchableOpacity
-            key={article._id}
             style={[
               styles.articleCard,
               {
@@ -96,11 +115,13 @@ export default function NewsScreen() {
             activeOpacity={0.8}
           >
             {/* Article Image */}
-            <Image
-              source={{ uri: article.image_base64 }}
-              style={styles.articleImage}
-              resizeMode="cover"
-            />
+            {article.image_url && (
+              <Image
+                source={{ uri: `${BACKEND_URL}${article.image_url}` }}
+                style={styles.articleImage}
+                resizeMode="cover"
+              />
+            )}
 
             {/* Truth Score Badge */}
             <View
@@ -139,8 +160,8 @@ export default function NewsScreen() {
               </View>
             </View>
           </TouchableOpacity>
-        ))}
-      </ScrollView>
+        )}
+      />
 
       {/* Fact vs Claim Modal */}
       <Modal
@@ -0,0 +1,32 @@
+import pytest
+from fastapi import HTTPException
+
+from server import parse_byte_range
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=900-5000", (900, 999)),  # end is clamped to the last byte
+        ("bytes=-5000", (0, 999)),  # suffix longer than the blob
+        (" bytes=0-0 ", (0, 0)),
+    ],
+)
+def test_satisfiable_ranges(header, expected):
+    assert parse_byte_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=-", "items=0-1", "bytes=0-1,5-6", "bytes=a-b"])
+def test_unparseable_ranges_are_ignored(header):
+    assert parse_byte_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=500-100"])
+def test_unsatisfiable_ranges_are_416(header):
+    with pytest.raises(HTTPException) as excinfo:
+        parse_byte_range(header, 1000)
+    assert excinfo.value.status_code == 416
+    assert excinfo.value.headers["Content-Range"] == "bytes */1000"
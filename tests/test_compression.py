@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+
+import pytest
+
+import server
+from server import COMPRESSION_MIN_BYTES, CompressionMiddleware, negotiate_encoding
+
+BEST = next(iter(server.COMPRESSORS))  # br when brotli is installed, else gzip
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", BEST),
+        ("gzip;q=0", None),
+        ("gzip;q=0.5, br;q=0", "gzip"),
+        ("*", BEST),
+        ("*;q=0", None),
+        ("GZIP;q=bogus, gzip", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept, expected):
+    assert negotiate_encoding(accept) == expected
+
+
+def run(messages, accept="gzip", method="GET"):
+    """Runs the middleware around an app that sends the given messages"""
+
+    async def app(scope, receive, send):
+        for message in messages:
+            await send(message)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "headers": [(b"accept-encoding", accept.encode())]}
+    asyncio.run(CompressionMiddleware(app)(scope, None, send))
+    return sent
+
+
+def start(status=200, content_type="application/json", **extra):
+    headers = [(b"content-type", content_type.encode())]
+    headers += [(name.replace("_", "-").encode(), value.encode()) for name, value in extra.items()]
+    return {"type": "http.response.start", "status": status, "headers": headers}
+
+
+def body(data, more_body=False):
+    return {"type": "http.response.body", "body": data, "more_body": more_body}
+
+
+def header(message, name):
+    return dict(message["headers"]).get(name.encode())
+
+
+def test_large_body_is_gzipped():
+    payload = b'{"news": []}' * 200
+    sent = run([start(content_length=str(len(payload))), body(payload)])
+    assert header(sent[0], "content-encoding") == b"gzip"
+    assert header(sent[0], "content-length") is None
+    assert b"Accept-Encoding" in header(sent[0], "vary")
+    assert gzip.decompress(sent[1]["body"]) == payload
+
+
+def test_streamed_body_is_compressed_chunk_by_chunk():
+    chunks = [b'{"n": %d}\n' % index for index in range(3)]
+    sent = run([start(content_type="application/x-ndjson")] + [body(chunk, more_body=True) for chunk in chunks] + [body(b"")])
+    assert header(sent[0], "content-encoding") == b"gzip"
+    assert len(sent) == 5  # every chunk is flushed as it arrives
+    assert all(message["body"] for message in sent[1:4])
+    assert gzip.decompress(b"".join(message["body"] for message in sent[1:])) == b"".join(chunks)
+
+
+def test_compressed_body_gets_a_weak_etag():
+    payload = b'{"news": []}' * 200
+    sent = run([start(etag='"3.1"'), body(payload)])
+    assert header(sent[0], "etag") == b'W/"3.1"'
+    assert server.etag_matches(header(sent[0], "etag").decode(), '"3.1"')
+    sent = run([start(etag='W/"3.1"'), body(payload)])
+    assert header(sent[0], "etag") == b'W/"3.1"'
+
+
+@pytest.mark.parametrize(
+    "messages",
+    [
+        [start(), body(b"x" * (COMPRESSION_MIN_BYTES - 1))],  # under the threshold
+        [start(content_type="text/event-stream"), body(b"data: 1\n\n", more_body=True), body(b"")],
+        [start(content_type="image/png"), body(b"x" * 10 * COMPRESSION_MIN_BYTES)],
+        [start(content_encoding="gzip"), body(b"x" * 10 * COMPRESSION_MIN_BYTES)],
+        [start(status=206), body(b"x" * 10 * COMPRESSION_MIN_BYTES)],
+        [start(status=304), body(b"")],
+    ],
+)
+def test_pass_through(messages):
+    assert run(messages) == messages
+
+
+def test_pass_through_without_an_accepted_encoding():
+    messages = [start(), body(b"x" * 10 * COMPRESSION_MIN_BYTES)]
+    assert run(messages, accept="identity") == messages
+
+
+def test_pass_through_for_head():
+    messages = [start(), body(b"")]
+    assert run(messages, method="HEAD") == messages
+
+
+def test_brotli_is_preferred_when_installed():
+    brotli = pytest.importorskip("brotli")
+    payload = b'{"news": []}' * 200
+    sent = run([start(), body(payload)], accept="gzip, br")
+    assert header(sent[0], "content-encoding") == b"br"
+    assert brotli.decompress(sent[1]["body"]) == payload
@@ -0,0 +1,31 @@
+import pytest
+
+from server import LATENCY_BUCKETS, RouteMetrics
+
+
+def metrics_with(counts):
+    metrics = RouteMetrics()
+    for index, count in counts.items():
+        metrics.buckets[index] = count
+        metrics.count += count
+    return metrics
+
+
+def test_quantile_interpolates_inside_the_bucket():
+    # 100 observations in (0.01, 0.025]
+    metrics = metrics_with({2: 100})
+    assert metrics.quantile(0.5) == pytest.approx(0.0175)
+    assert metrics.quantile(1.0) == pytest.approx(0.025)
+
+
+def test_quantile_picks_the_bucket_holding_the_rank():
+    # 90 fast requests in [0, 0.005], 10 slow ones in (0.5, 1.0]
+    metrics = metrics_with({0: 90, 7: 10})
+    assert metrics.quantile(0.5) == pytest.approx(0.005 * 50 / 90)
+    assert metrics.quantile(0.95) == pytest.approx(0.5 + 0.5 * 5 / 10)
+    assert metrics.quantile(0.99) == pytest.approx(0.5 + 0.5 * 9 / 10)
+
+
+def test_quantile_beyond_the_last_bound_reports_it():
+    metrics = metrics_with({len(LATENCY_BUCKETS): 10})
+    assert metrics.quantile(0.5) == LATENCY_BUCKETS[-1]
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from server import decode_news_cursor, encode_news_cursor
+
+
+def test_cursor_round_trip_gives_keyset_condition():
+    article = {"_id": ObjectId(), "created_at": datetime(2026, 1, 2, 3, 4, 5, 678000)}
+    condition = decode_news_cursor(encode_news_cursor(article))
+    assert condition == {
+        "$or": [
+            {"created_at": {"$lt": article["created_at"]}},
+            {"created_at": article["created_at"], "_id": {"$lt": article["_id"]}},
+        ]
+    }
+
+
+@pytest.mark.parametrize("cursor", ["", "garbage", "2026-01-02T03:04:05,not-an-id", f"yesterday,{ObjectId()}"])
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_news_cursor(cursor)
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import AutoReconnect
+
+import server
+from server import PollVoteBuffer
+
+
+class FakePolls:
+    def __init__(self, poll):
+        self.poll = poll
+        self.gate = None  # when set, writes wait for it
+        self.failures = 0
+
+    async def find_one(self, query, projection=None):
+        return dict(self.poll) if query["_id"] == self.poll["_id"] else None
+
+    async def find_one_and_update(self, query, update, return_document=None):
+        if self.gate:
+            await self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise AutoReconnect("connection reset")
+        for option, count in update["$inc"].items():
+            self.poll[option] += count
+        return dict(self.poll)
+
+
+class FakeBuckets:
+    def __init__(self):
+        self.writes = []
+        self.failures = 0
+
+    async def bulk_write(self, requests, ordered=True):
+        if self.failures:
+            self.failures -= 1
+            raise AutoReconnect("connection reset")
+        self.writes.extend(requests)
+
+
+class FakeDatabase:
+    def __init__(self, poll):
+        self.polls = FakePolls(poll)
+        self.poll_vote_buckets = FakeBuckets()
+
+
+@pytest.fixture
+def poll_db(monkeypatch):
+    poll = {"_id": ObjectId(), "question_en": "Q", "yes": 5, "no": 2}
+    fake = FakeDatabase(poll)
+
+    async def resource_changed(resource):
+        pass
+
+    monkeypatch.setattr(server, "db", fake)
+    monkeypatch.setattr(server, "resource_changed", resource_changed)
+    monkeypatch.setattr(server, "poll_stream", server.PollBroadcaster())
+    return fake
+
+
+def test_add_reports_stored_tally_plus_pending(poll_db):
+    async def scenario():
+        votes = PollVoteBuffer()
+        poll_id = poll_db.polls.poll["_id"]
+        await votes.add(poll_id, "yes")
+        return await votes.add(poll_id, "no")
+
+    poll = asyncio.run(scenario())
+    assert (poll["yes"], poll["no"]) == (6, 3)
+    assert poll["_id"] == str(poll_db.polls.poll["_id"])
+    assert poll_db.polls.poll["yes"] == 5  # nothing written before a flush
+
+
+def test_unknown_poll_is_404(poll_db):
+    async def scenario():
+        await PollVoteBuffer().add(ObjectId(), "yes")
+
+    with pytest.raises(server.HTTPException) as excinfo:
+        asyncio.run(scenario())
+    assert excinfo.value.status_code == 404
+
+
+def test_flush_writes_the_batch_and_installs_new_tallies(poll_db):
+    async def scenario():
+        votes = PollVoteBuffer()
+        poll_id = poll_db.polls.poll["_id"]
+        for _ in range(3):
+            await votes.add(poll_id, "yes")
+        await votes.flush()
+        return votes, votes.view(poll_id)
+
+    votes, poll = asyncio.run(scenario())
+    assert poll_db.polls.poll["yes"] == 8
+    assert poll["yes"] == 8
+    assert votes.pending == {} and votes.flushing == {}
+    buckets = {request._filter["granularity"]: request._doc["$inc"] for request in poll_db.poll_vote_buckets.writes}
+    assert buckets == {"minute": {"yes": 3}, "hour": {"yes": 3}, "day": {"yes": 3}}
+
+
+def test_tally_does_not_go_backwards_during_a_flush(poll_db):
+    async def scenario():
+        votes = PollVoteBuffer()
+        poll_id = poll_db.polls.poll["_id"]
+        for _ in range(10):
+            await votes.add(poll_id, "yes")
+        poll_db.polls.gate = asyncio.Event()
+        flush = asyncio.create_task(votes.flush())
+        await asyncio.sleep(0)  # the batch is now in flight
+        during = await votes.add(poll_id, "yes")
+        poll_db.polls.gate.set()
+        await flush
+        return during, votes.view(poll_id)
+
+    during, after = asyncio.run(scenario())
+    assert during["yes"] == 16
+    assert after["yes"] == 16
+    assert poll_db.polls.poll["yes"] == 15  # the mid-flush vote waits for the next flush
+
+
+def test_failed_flush_keeps_votes_for_the_next_one(poll_db):
+    async def scenario():
+        votes = PollVoteBuffer()
+        poll_id = poll_db.polls.poll["_id"]
+        for _ in range(4):
+            await votes.add(poll_id, "no")
+        poll_db.polls.failures = 1
+        poll_db.poll_vote_buckets.failures = 1
+        await votes.flush()
+        after_failure = votes.view(poll_id)
+        stored_after_failure = poll_db.polls.poll["no"]
+        await votes.flush()
+        return after_failure, stored_after_failure, votes
+
+    after_failure, stored_after_failure, votes = asyncio.run(scenario())
+    assert after_failure["no"] == 6
+    assert stored_after_failure == 2
+    assert poll_db.polls.poll["no"] == 6
+    assert votes.view(poll_db.polls.poll["_id"])["no"] == 6
+    assert votes.pending == {} and votes.buckets == {}
+    assert len(poll_db.poll_vote_buckets.writes) == 3  # one bucket per granularity, written once
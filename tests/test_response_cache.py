@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from server import CacheBackend, InMemoryCacheBackend, ResponseCache
+
+
+class CountingLoader:
+    def __init__(self, value=b"body", delay=0.01, error=None):
+        self.value = value
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.value
+
+
+def test_concurrent_misses_share_one_load():
+    async def scenario():
+        cache = ResponseCache(max_entries=10)
+        loader = CountingLoader()
+        results = await asyncio.gather(*(cache.get_or_load("news:1:page", 30, loader) for _ in range(20)))
+        return loader.calls, results, cache.inflight
+
+    calls, results, inflight = asyncio.run(scenario())
+    assert calls == 1
+    assert results == [b"body"] * 20
+    assert inflight == {}
+
+
+def test_failed_load_reaches_every_waiter_and_is_not_cached():
+    async def scenario():
+        cache = ResponseCache(max_entries=10)
+        failing = CountingLoader(error=RuntimeError("mongo down"))
+        results = await asyncio.gather(
+            *(cache.get_or_load("polls:1:x", 30, failing) for _ in range(5)), return_exceptions=True
+        )
+        recovered = CountingLoader(value=b"fresh")
+        value = await cache.get_or_load("polls:1:x", 30, recovered)
+        return failing.calls, results, recovered.calls, value
+
+    failing_calls, results, recovered_calls, value = asyncio.run(scenario())
+    assert failing_calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert (recovered_calls, value) == (1, b"fresh")
+
+
+def test_cancelled_leader_does_not_cancel_its_waiters():
+    async def scenario():
+        cache = ResponseCache(max_entries=10)
+        loader = CountingLoader(delay=0.05)
+        leader = asyncio.create_task(cache.get_or_load("polls:1:x", 30, loader))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(cache.get_or_load("polls:1:x", 30, loader)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        return leader.cancelled(), results, loader.calls, cache.inflight
+
+    leader_cancelled, results, calls, inflight = asyncio.run(scenario())
+    assert leader_cancelled
+    assert results == [b"body"] * 3
+    assert calls == 2  # the abandoned load plus one retry shared by the waiters
+    assert inflight == {}
+
+
+def test_invalidate_drops_only_that_resource():
+    async def scenario():
+        cache = ResponseCache(max_entries=10)
+        news, polls = CountingLoader(b"news"), CountingLoader(b"polls")
+        for _ in range(2):
+            await cache.get_or_load("news:1:page", 30, news)
+            await cache.get_or_load("polls:1:list", 30, polls)
+        await cache.invalidate("news")
+        await cache.get_or_load("news:1:page", 30, news)
+        await cache.get_or_load("polls:1:list", 30, polls)
+        return news.calls, polls.calls
+
+    assert asyncio.run(scenario()) == (2, 1)
+
+
+def test_expired_entries_reload():
+    async def scenario():
+        cache = ResponseCache(max_entries=10)
+        loader = CountingLoader(delay=0)
+        await cache.get_or_load("quotes:1:today", 0.01, loader)
+        await asyncio.sleep(0.02)
+        await cache.get_or_load("quotes:1:today", 0.01, loader)
+        return loader.calls
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    async def scenario():
+        cache = ResponseCache(max_entries=2)
+        loader = CountingLoader(delay=0)
+        await cache.get_or_load("news:1:a", 30, loader)
+        await cache.get_or_load("news:1:b", 30, loader)
+        await cache.get_or_load("news:1:a", 30, loader)  # a is now the most recent
+        await cache.get_or_load("news:1:c", 30, loader)
+        return list(cache.entries)
+
+    assert asyncio.run(scenario()) == ["news:1:a", "news:1:c"]
+
+
+def test_shared_backend_is_filled_and_invalidated():
+    async def scenario():
+        backend = InMemoryCacheBackend()
+        first, second = ResponseCache(10, backend), ResponseCache(10, backend)
+        loader = CountingLoader()
+        await first.get_or_load("news:1:page", 30, loader)
+        from_backend = await second.get_or_load("news:1:page", 30, loader)
+        await first.invalidate("news")
+        return loader.calls, from_backend, await backend.get("news:1:page")
+
+    assert asyncio.run(scenario()) == (1, b"body", None)
+
+
+def test_memory_backend_is_bounded():
+    async def scenario():
+        backend = InMemoryCacheBackend(max_entries=3)
+        for index in range(10):
+            await backend.set(f"news:1:{index}", index, 30)
+        return list(backend.entries)
+
+    assert asyncio.run(scenario()) == ["news:1:7", "news:1:8", "news:1:9"]
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
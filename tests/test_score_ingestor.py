@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+import server
+from server import GameScoreIngestor
+
+
+def duplicate(index):
+    return {"index": index, "code": 11000, "errmsg": "E11000 duplicate key error"}
+
+
+def invalid(index):
+    return {"index": index, "code": 121, "errmsg": "Document failed validation"}
+
+
+class FakeScores:
+    def __init__(self, *outcomes):
+        # One outcome per insert_many call: an exception to raise, or None to succeed
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    async def insert_many(self, batch, ordered=True):
+        self.calls.append(list(batch))
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if outcome:
+            raise outcome
+
+
+@pytest.fixture
+def scores(monkeypatch):
+    credited = []
+
+    async def credit_user_xp(written):
+        credited.extend(written)
+
+    async def no_sleep(seconds):
+        pass
+
+    def install(*outcomes):
+        fake = FakeScores(*outcomes)
+        monkeypatch.setattr(server, "db", type("FakeDatabase", (), {"game_scores": fake})())
+        return fake
+
+    monkeypatch.setattr(server, "credit_user_xp", credit_user_xp)
+    monkeypatch.setattr(server.asyncio, "sleep", no_sleep)
+    install.credited = credited
+    return install
+
+
+def batch(count):
+    return [{"_id": ObjectId(), "user_email": f"player{index}@example.com", "xp_earned": 10} for index in range(count)]
+
+
+def test_clean_insert_is_written_once_and_credited(scores):
+    collection = scores()
+    written = batch(3)
+    asyncio.run(GameScoreIngestor().write(written))
+    assert collection.calls == [written]
+    assert scores.credited == written
+
+
+def test_duplicate_on_first_attempt_is_not_credited(scores):
+    scores(BulkWriteError({"writeErrors": [duplicate(1)]}))
+    written = batch(3)
+    asyncio.run(GameScoreIngestor().write(written))
+    # A duplicate on a first attempt is a replayed _id, not our earlier write
+    assert scores.credited == [written[0], written[2]]
+
+
+def test_duplicate_after_a_failed_attempt_is_credited(scores):
+    collection = scores(AutoReconnect("connection reset"), BulkWriteError({"writeErrors": [duplicate(1)]}))
+    written = batch(3)
+    asyncio.run(GameScoreIngestor().write(written))
+    # The first attempt may have landed score 1 before the connection dropped
+    assert len(collection.calls) == 2
+    assert scores.credited == written
+
+
+def test_duplicate_while_draining_is_credited(scores):
+    scores(BulkWriteError({"writeErrors": [duplicate(0)]}))
+    ingestor = GameScoreIngestor()
+    ingestor.in_flight = batch(2)
+    expected = list(ingestor.in_flight)
+    asyncio.run(ingestor.drain())
+    assert scores.credited == expected
+
+
+def test_non_duplicate_write_error_is_dropped(scores):
+    scores(BulkWriteError({"writeErrors": [invalid(0), duplicate(2)]}))
+    written = batch(3)
+    asyncio.run(GameScoreIngestor().write(written, retried=True))
+    assert scores.credited == [written[1], written[2]]
+
+
+def test_batch_is_dropped_after_every_attempt_fails(scores):
+    collection = scores(*[AutoReconnect("connection reset")] * server.SCORE_WRITE_ATTEMPTS)
+    asyncio.run(GameScoreIngestor().write(batch(2)))
+    assert len(collection.calls) == server.SCORE_WRITE_ATTEMPTS
+    assert scores.credited == []
+
+
+def test_full_queue_sheds_the_whole_submission(monkeypatch):
+    monkeypatch.setattr(server, "SCORE_QUEUE_MAX", 3)
+    ingestor = GameScoreIngestor()
+    ids = ingestor.submit(batch(2))
+    assert len(ids) == 2 and ingestor.queue.qsize() == 2
+    with pytest.raises(HTTPException) as excinfo:
+        ingestor.submit(batch(2))
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.headers["Retry-After"] == "1"
+    # Nothing from the rejected submission was queued
+    assert ingestor.queue.qsize() == 2
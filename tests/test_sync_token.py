@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+import server
+from server import decode_sync_token, encode_sync_token, sync_changes, sync_query
+
+
+def test_plain_timestamp_token_is_inclusive():
+    moment = datetime(2026, 1, 2, 3, 4, 5, 678000)
+    since, collection, after_id = decode_sync_token(encode_sync_token(moment))
+    assert (since, collection, after_id) == (moment, None, None)
+    assert sync_query(since, after_id) == {"updated_at": {"$gte": moment}}
+
+
+def test_resume_token_round_trip_gives_keyset_condition():
+    moment, doc_id = datetime(2026, 1, 2, 3, 4, 5), ObjectId()
+    since, collection, after_id = decode_sync_token(encode_sync_token(moment, "news", doc_id))
+    assert (since, collection, after_id) == (moment, "news", doc_id)
+    assert sync_query(since, after_id) == {
+        "$or": [
+            {"updated_at": {"$gt": moment}},
+            {"updated_at": moment, "_id": {"$gt": doc_id}},
+        ]
+    }
+
+
+def test_aware_timestamp_is_normalised_to_utc():
+    since, _, _ = decode_sync_token("2026-01-02T08:34:05+05:30")
+    assert since == datetime(2026, 1, 2, 3, 4, 5)
+
+
+@pytest.mark.parametrize("token", ["garbage", f"2026-01-02T03:04:05,volunteers,{ObjectId()}", "2026-01-02T03:04:05,news,not-an-id"])
+def test_invalid_token_is_a_400(token):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_sync_token(token)
+    assert excinfo.value.status_code == 400
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, keys):
+        for key, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc[key], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+def matches(doc, query):
+    if "$or" in query:
+        return any(matches(doc, branch) for branch in query["$or"])
+    for field, condition in query.items():
+        if not isinstance(condition, dict):
+            if doc[field] != condition:
+                return False
+            continue
+        for operator, value in condition.items():
+            if not {"$gt": doc[field] > value, "$gte": doc[field] >= value}[operator]:
+                return False
+    return True
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        return FakeCursor([dict(doc) for doc in self.docs if matches(doc, query)])
+
+
+def test_pages_through_more_than_a_page_of_equal_timestamps(monkeypatch):
+    moment = datetime(2026, 1, 2, 3, 4, 5)
+    docs = [{"_id": ObjectId(), "updated_at": moment} for _ in range(7)]
+    monkeypatch.setattr(server, "db", {"news": FakeCollection(docs)})
+    monkeypatch.setattr(server, "SYNC_LIMIT", 3)
+
+    async def page_through():
+        seen, since, after_id = [], None, None
+        while True:
+            page, truncated = await sync_changes("news", since, after_id, None)
+            seen.extend(doc["_id"] for doc in page)
+            if not truncated:
+                return seen
+            since, _, after_id = decode_sync_token(encode_sync_token(page[-1]["updated_at"], "news", page[-1]["_id"]))
+
+    assert asyncio.run(page_through()) == sorted(doc["_id"] for doc in docs)
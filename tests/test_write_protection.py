@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+import server
+from server import InMemoryRateLimitStore, RateLimitStore, WindowedBloomFilter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(server.time, "monotonic", fake)
+    return fake
+
+
+def test_bloom_filter_remembers_added_keys(clock):
+    seen = WindowedBloomFilter(capacity=1000, error_rate=0.001, window=60)
+    assert "poll:device-1" not in seen
+    seen.add("poll:device-1")
+    assert "poll:device-1" in seen
+    assert "poll:device-2" not in seen
+
+
+def test_bloom_filter_forgets_after_two_windows(clock):
+    seen = WindowedBloomFilter(capacity=1000, error_rate=0.001, window=60)
+    seen.add("key")
+    clock.now += 61
+    assert "key" in seen  # moved to the previous generation
+    clock.now += 61
+    assert "key" not in seen
+
+
+def test_bloom_filter_forgets_after_a_long_idle_gap(clock):
+    seen = WindowedBloomFilter(capacity=1000, error_rate=0.001, window=60)
+    seen.add("key")
+    clock.now += 200
+    assert "key" not in seen
+
+
+def test_bloom_filter_rotates_early_when_full(clock):
+    seen = WindowedBloomFilter(capacity=1000, error_rate=0.001, window=3600)
+    for index in range(3000):
+        seen.add(f"voter-{index}")
+    assert seen.count < 1000
+    assert all(f"voter-{index}" in seen for index in range(2000, 3000))
+    false_positives = sum(f"stranger-{index}" in seen for index in range(10000))
+    assert false_positives / 10000 < 0.01
+
+
+def test_rate_limit_allows_the_burst_then_asks_to_wait(clock):
+    async def scenario():
+        store = InMemoryRateLimitStore()
+        waits = [await store.take("vote:1.2.3.4", rate=1, burst=3) for _ in range(4)]
+        clock.now += 0.5
+        half_refilled = await store.take("vote:1.2.3.4", rate=1, burst=3)
+        clock.now += 1
+        refilled = await store.take("vote:1.2.3.4", rate=1, burst=3)
+        other_client = await store.take("vote:5.6.7.8", rate=1, burst=3)
+        return waits, half_refilled, refilled, other_client
+
+    waits, half_refilled, refilled, other_client = asyncio.run(scenario())
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3] == pytest.approx(1.0)
+    assert half_refilled == pytest.approx(0.5)
+    assert refilled == 0
+    assert other_client == 0
+
+
+def test_rate_limit_store_evicts_least_recent_clients(clock):
+    async def scenario():
+        store = InMemoryRateLimitStore(max_keys=2)
+        for key in ("a", "b", "a", "c"):
+            await store.take(key, rate=1, burst=5)
+        return list(store.buckets)
+
+    assert asyncio.run(scenario()) == ["a", "c"]
+
+
+def test_rate_limit_store_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitStore()
+
+
+class FakeVolunteers:
+    def __init__(self):
+        self.docs = []
+
+    async def find_one(self, query, projection=None):
+        for doc in self.docs:
+            if any(all(doc.get(field) == value for field, value in branch.items()) for branch in query["$or"]):
+                return doc
+        return None
+
+    async def insert_one(self, doc):
+        doc = {**doc, "_id": len(self.docs) + 1}
+        self.docs.append(doc)
+        return type("InsertOneResult", (), {"inserted_id": doc["_id"]})()
+
+
+@pytest.fixture
+def volunteers(monkeypatch, clock):
+    fake = FakeVolunteers()
+    monkeypatch.setattr(server, "db", type("FakeDatabase", (), {"volunteers": fake})())
+    monkeypatch.setattr(server, "volunteer_dedupe", WindowedBloomFilter(capacity=1000, error_rate=0.001, window=60))
+    return fake
+
+
+def sign_up(email, phone):
+    form = server.VolunteerForm(name="Asha", email=email, phone=phone, state="Kerala", message="")
+    return asyncio.run(server.submit_volunteer_form(form))
+
+
+def test_volunteer_retry_with_other_email_case_is_a_duplicate(volunteers):
+    first = sign_up("Asha@Example.com ", "98765 43210")
+    again = sign_up("asha@example.com", "11111 11111")
+    assert again["duplicate"] and again["id"] == first["id"]
+    assert volunteers.docs[0]["email"] == "asha@example.com"
+
+
+def test_volunteer_with_same_phone_digits_is_a_duplicate(volunteers):
+    first = sign_up("asha@example.com", "+91 98765-43210")
+    again = sign_up("other@example.com", "919876543210")
+    assert again["duplicate"] and again["id"] == first["id"]
+    assert len(volunteers.docs) == 1
+
+
+def test_distinct_volunteers_are_both_stored(volunteers):
+    sign_up("asha@example.com", "98765 43210")
+    assert "duplicate" not in sign_up("ravi@example.com", "91234 56789")
+    assert len(volunteers.docs) == 2